@@ -0,0 +1,50 @@
+// Criterion benchmark of GHZ state preparation in pure Rust.
+//
+// Runs the same construction as `create_ghz_gates()` in
+// benchmark_overhead_v2.py (ket + H + CNOT chain through the default fusion
+// pass), so the Python script can read the native timings from
+// target/criterion/ghz/<n>/new/estimates.json instead of hardcoding them.
+// The ghz_unfused group runs the same ops one at a time (max_fuse_size=0),
+// to weigh the fused permutation gates against per-CNOT swaps.
+//
+// Run with: cargo bench --bench ghz
+
+use criterion::{black_box, criterion_group, criterion_main, BenchmarkId, Criterion};
+use rvecsim::{fuse, ket, Op, QReg};
+
+/// Qubit counts, matching the sizes the Python benchmarks report.
+const SIZES: [usize; 6] = [5, 10, 15, 18, 20, 22];
+
+/// Same default as `QReg.apply_circuit(ops)` in the Python bindings.
+const MAX_FUSE_SIZE: usize = 4;
+
+/// Build the GHZ state; `max_fuse_size` 0 skips fusion, as in Python.
+fn create_ghz_rust(n: usize, max_fuse_size: usize) -> QReg {
+    let ops: Vec<Op> = std::iter::once(Op::H(0))
+        .chain((0..n - 1).map(|i| Op::Cnot(i, i + 1)))
+        .collect();
+    let mut q = ket(&"0".repeat(n));
+    if max_fuse_size == 0 {
+        q.apply_circuit(&ops);
+    } else {
+        q.apply_fused_circuit(&fuse(&ops, max_fuse_size));
+    }
+    q
+}
+
+fn bench_ghz(c: &mut Criterion) {
+    for (name, max_fuse_size) in [("ghz", MAX_FUSE_SIZE), ("ghz_unfused", 0)] {
+        let mut group = c.benchmark_group(name);
+        for n in SIZES {
+            // Large states take tens of ms per iteration; keep the run short
+            group.sample_size(if n >= 18 { 10 } else { 100 });
+            group.bench_with_input(BenchmarkId::from_parameter(n), &n, |b, &n| {
+                b.iter(|| create_ghz_rust(black_box(n), max_fuse_size))
+            });
+        }
+        group.finish();
+    }
+}
+
+criterion_group!(benches, bench_ghz);
+criterion_main!(benches);
@@ -0,0 +1,168 @@
+// Criterion benchmark of state-vector layout for single-qubit gates.
+//
+// Compares the interleaved Complex64 state QReg uses (array of structs, run
+// through the SIMD kernels in src/simd.rs) with separate re/im Vec<f64>
+// (structure of arrays, written as lane-wise loops for the compiler to
+// vectorize; target 0 de-interleaves even/odd pairs per block). Both sides
+// split the state the way `for_each_pair_run` does, including the big-stride
+// regime, so the difference is the layout and kernel alone.
+//
+// Run with: RUSTFLAGS="-C target-cpu=native" cargo bench --bench layout
+
+use criterion::{black_box, criterion_group, criterion_main, BenchmarkId, Criterion};
+use ndarray::{array, Array2};
+use num_complex::Complex64;
+use rayon::prelude::*;
+use rvecsim::{ket, H_GATE};
+
+/// 2^20 amplitudes: 16 MB per state, well outside L2
+const N: usize = 20;
+
+/// Lowest, middle and highest target qubit (adjacent, strided, big stride)
+const TARGETS: [usize; 3] = [0, 10, N - 1];
+
+/// Amplitudes handled per rayon task, as in src/lib.rs
+const TILE: usize = 1 << 14;
+
+/// State vector stored as separate real and imaginary parts.
+struct SoaState {
+    re: Vec<f64>,
+    im: Vec<f64>,
+}
+
+impl SoaState {
+    fn uniform(n: usize) -> Self {
+        let a = (1.0 / (1usize << n) as f64).sqrt();
+        SoaState {
+            re: vec![a; 1 << n],
+            im: vec![0.0; 1 << n],
+        }
+    }
+
+    /// Same three regimes as `for_each_pair_run` in src/lib.rs: adjacent
+    /// pairs (target 0), whole blocks per tile, and runs split across tasks
+    /// once a block is larger than a tile.
+    fn apply1q(&mut self, m: &Array2<Complex64>, target: usize) {
+        let m = [m[[0, 0]], m[[0, 1]], m[[1, 0]], m[[1, 1]]];
+        let stride = 1 << target;
+        let (re, im) = (&mut self.re, &mut self.im);
+        if stride == 1 {
+            re.par_chunks_mut(TILE)
+                .zip(im.par_chunks_mut(TILE))
+                .for_each(|(re, im)| adjacent(re, im, &m));
+        } else if 2 * stride <= TILE {
+            re.par_chunks_mut(TILE)
+                .zip(im.par_chunks_mut(TILE))
+                .for_each(|(re, im)| {
+                    let blocks = re
+                        .chunks_exact_mut(2 * stride)
+                        .zip(im.chunks_exact_mut(2 * stride));
+                    for (re, im) in blocks {
+                        let (re_lo, re_hi) = re.split_at_mut(stride);
+                        let (im_lo, im_hi) = im.split_at_mut(stride);
+                        strided(re_lo, im_lo, re_hi, im_hi, &m);
+                    }
+                });
+        } else {
+            let blocks = re
+                .chunks_exact_mut(2 * stride)
+                .zip(im.chunks_exact_mut(2 * stride));
+            for (re, im) in blocks {
+                let (re_lo, re_hi) = re.split_at_mut(stride);
+                let (im_lo, im_hi) = im.split_at_mut(stride);
+                re_lo
+                    .par_chunks_mut(TILE / 2)
+                    .zip(im_lo.par_chunks_mut(TILE / 2))
+                    .zip(re_hi.par_chunks_mut(TILE / 2))
+                    .zip(im_hi.par_chunks_mut(TILE / 2))
+                    .for_each(|(((rl, il), rh), ih)| strided(rl, il, rh, ih, &m));
+            }
+        }
+    }
+}
+
+/// One output pair of the 2x2 complex gate `m` applied to (a, b).
+#[inline(always)]
+fn gate_pair(m: &[Complex64; 4], ar: f64, ai: f64, br: f64, bi: f64) -> [f64; 4] {
+    [
+        m[0].re * ar - m[0].im * ai + m[1].re * br - m[1].im * bi,
+        m[0].re * ai + m[0].im * ar + m[1].re * bi + m[1].im * br,
+        m[2].re * ar - m[2].im * ai + m[3].re * br - m[3].im * bi,
+        m[2].re * ai + m[2].im * ar + m[3].re * bi + m[3].im * br,
+    ]
+}
+
+/// Pairs (lo[k], hi[k]): every lane is independent, so this vectorizes as is.
+fn strided(
+    re_lo: &mut [f64],
+    im_lo: &mut [f64],
+    re_hi: &mut [f64],
+    im_hi: &mut [f64],
+    m: &[Complex64; 4],
+) {
+    for k in 0..re_lo.len() {
+        let [lr, li, hr, hi] = gate_pair(m, re_lo[k], im_lo[k], re_hi[k], im_hi[k]);
+        (re_lo[k], im_lo[k], re_hi[k], im_hi[k]) = (lr, li, hr, hi);
+    }
+}
+
+/// Lanes per de-interleaved block in `adjacent` (one AVX-512 register of f64).
+const LANES: usize = 8;
+
+/// Pairs (v[2k], v[2k + 1]): de-interleave even and odd lanes of each block
+/// into contiguous arrays, apply the gate lane-wise, and interleave back.
+fn adjacent(re: &mut [f64], im: &mut [f64], m: &[Complex64; 4]) {
+    let blocks = re.chunks_exact_mut(2 * LANES).zip(im.chunks_exact_mut(2 * LANES));
+    for (re, im) in blocks {
+        let [mut ar, mut ai, mut br, mut bi] = [[0.0; LANES]; 4];
+        for j in 0..LANES {
+            (ar[j], br[j]) = (re[2 * j], re[2 * j + 1]);
+            (ai[j], bi[j]) = (im[2 * j], im[2 * j + 1]);
+        }
+        let [mut lr, mut li, mut hr, mut hi] = [[0.0; LANES]; 4];
+        for j in 0..LANES {
+            [lr[j], li[j], hr[j], hi[j]] = gate_pair(m, ar[j], ai[j], br[j], bi[j]);
+        }
+        for j in 0..LANES {
+            (re[2 * j], re[2 * j + 1]) = (lr[j], hr[j]);
+            (im[2 * j], im[2 * j + 1]) = (li[j], hi[j]);
+        }
+    }
+    // Tiles shorter than one block (tiny registers)
+    let tail = re.len() - re.len() % (2 * LANES);
+    for k in (tail..re.len()).step_by(2) {
+        let [lr, li, hr, hi] = gate_pair(m, re[k], im[k], re[k + 1], im[k + 1]);
+        (re[k], im[k], re[k + 1], im[k + 1]) = (lr, li, hr, hi);
+    }
+}
+
+fn bench_layout(c: &mut Criterion) {
+    // H takes the real-coefficient kernels; S.H needs complex arithmetic
+    let s2 = std::f64::consts::FRAC_1_SQRT_2;
+    let sh: Array2<Complex64> = array![
+        [Complex64::new(s2, 0.0), Complex64::new(s2, 0.0)],
+        [Complex64::new(0.0, s2), Complex64::new(0.0, -s2)]
+    ];
+    let gates = [("H", &*H_GATE), ("SH", &sh)];
+
+    for (name, m) in gates {
+        let mut group = c.benchmark_group(format!("layout/{name}"));
+        group.sample_size(20);
+        let mut aos = ket(&"+".repeat(N));
+        let mut soa = SoaState::uniform(N);
+        for t in TARGETS {
+            group.bench_with_input(BenchmarkId::new("aos", t), &t, |b, &t| {
+                b.iter(|| {
+                    aos.apply1q(m, black_box(t));
+                })
+            });
+            group.bench_with_input(BenchmarkId::new("soa", t), &t, |b, &t| {
+                b.iter(|| soa.apply1q(m, black_box(t)))
+            });
+        }
+        group.finish();
+    }
+}
+
+criterion_group!(benches, bench_layout);
+criterion_main!(benches);
@@ -3,20 +3,47 @@
 Clearer demonstration of PyO3 overhead by measuring actual boundary crossings.
 """
 
+import json
+import os
 import time
-from rvecsim import ket
-
-def measure(desc, func, n_trials=1000):
-    """Measure and print average execution time."""
-    times = []
+from rvecsim import ghz, ket
+
+def calibrate(func, min_ns=1_000_000):
+    """Number of back-to-back calls of func that take at least min_ns."""
+    inner = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(inner):
+            func()
+        if time.perf_counter_ns() - start >= min_ns:
+            return inner
+        inner *= 2
+
+def measure(desc, func, n_trials=100):
+    """Measure and print mean and min execution time; returns the min.
+
+    Each of the n_trials trials times a batch of calls lasting at least
+    1 ms with perf_counter_ns(), so timer resolution and overhead are
+    spread over the batch instead of landing on every sub-µs call.
+
+    Keeps a running (Welford) mean instead of a list of samples, so the
+    loop does no per-trial allocation. The min is the less noisy signal
+    for microbenchmarks, so comparisons between measurements use it.
+    """
+    inner = calibrate(func)
+    count = 0
+    mean = 0.0
+    best = float('inf')
     for _ in range(n_trials):
-        start = time.perf_counter()
-        result = func()
-        end = time.perf_counter()
-        times.append(end - start)
-    avg = sum(times) / len(times)
-    print(f"{desc:45} {avg*1e6:8.2f} µs")
-    return avg
+        start = time.perf_counter_ns()
+        for _ in range(inner):
+            func()
+        dt = (time.perf_counter_ns() - start) * 1e-9 / inner
+        count += 1
+        mean += (dt - mean) / count
+        best = min(best, dt)
+    print(f"{desc:45} {mean*1e6:8.2f} µs (min {best*1e6:8.2f} µs)")
+    return best
 
 def main():
     print("\n" + "=" * 70)
@@ -38,37 +65,54 @@ def main():
     print("-" * 70)
 
     # Small state, simple operations
+    # State prepared once; gates mutate it in place, so only the call is timed
     q_small = ket('00')
-    tx = measure("q.X(0) on 2-qubit state", lambda: ket('00').X(0))
-    th = measure("q.H(0) on 2-qubit state", lambda: ket('00').H(0))
-    tcnot = measure("q.CNOT(0,1) on 2-qubit state", lambda: ket('00').CNOT(0, 1))
+    tx = measure("q.X(0) on 2-qubit state", lambda: q_small.X(0))
+    th = measure("q.H(0) on 2-qubit state", lambda: q_small.H(0))
+    tcnot = measure("q.CNOT(0,1) on 2-qubit state", lambda: q_small.CNOT(0, 1))
+
+    # Same gate on a fresh copy / a fresh ket, to separate allocation costs
+    tcopy = measure("q.copy().X(0) on 2-qubit state", lambda: q_small.copy().X(0))
+    tket = measure("ket('00').X(0) on 2-qubit state", lambda: ket('00').X(0))
+
+    print(f"\nAllocation: copy() ~{(tcopy - tx)*1e6:.2f} µs, "
+          f"ket('00') ~{(tket - tx)*1e6:.2f} µs on top of the gate")
 
     print("\n3. CHAIN LENGTH IMPACT (multiple boundary crossings)")
     print("-" * 70)
 
-    chain1 = measure("1 gate:  ket('00').H(0)",
-                     lambda: ket('00').H(0))
+    # One 8-qubit register prepared up front (below the 10-qubit GIL-release
+    # threshold), so chains of every length do the same work per gate
+    q_chain = ket('0' * 8)
 
-    chain2 = measure("2 gates: ket('00').H(0).H(1)",
-                     lambda: ket('00').H(0).H(1))
+    chain1 = measure("1 gate:  q.H(0)",
+                     lambda: q_chain.H(0))
 
-    chain5 = measure("5 gates: ket('00000').H(0).H(1).H(2).H(3).H(4)",
-                     lambda: ket('00000').H(0).H(1).H(2).H(3).H(4))
+    chain2 = measure("2 gates: q.H(0).H(1)",
+                     lambda: q_chain.H(0).H(1))
 
-    chain10 = measure("10 gates: 10x H on 10 qubits",
-                      lambda: (ket('0000000000').H(0).H(1).H(2).H(3).H(4)
-                               .H(5).H(6).H(7).H(8).H(9)))
+    chain5 = measure("5 gates: q.H(0).H(1).H(2).H(3).H(4)",
+                     lambda: q_chain.H(0).H(1).H(2).H(3).H(4))
+
+    chain10 = measure("10 gates: q.H(0)...H(7).H(0).H(1)",
+                      lambda: (q_chain.H(0).H(1).H(2).H(3).H(4)
+                               .H(5).H(6).H(7).H(0).H(1)))
 
     per_gate = (chain10 - chain1) / 9
-    print(f"\nIncremental cost per gate: ~{per_gate*1e6:.2f} µs")
+    print(f"\nIncremental cost per gate: ~{per_gate*1e6:.2f} µs "
+          f"(2→5 gates: ~{(chain5 - chain2)/3*1e6:.2f} µs)")
 
     print("\n4. STATE SIZE IMPACT (larger quantum states)")
     print("-" * 70)
 
+    ghz_times = {}
     for n in [5, 10, 15, 18]:
         t = measure(f"GHZ-{n}: ket('{'0'*n}').H(0) + {n-1} CNOTs",
-                    lambda n=n: create_ghz(n),
+                    lambda n=n: create_ghz_gates(n),
                     n_trials=50 if n >= 15 else 200)
+        measure(f"GHZ-{n}: ghz({n}) (no gates)",
+                lambda n=n: create_ghz(n),
+                n_trials=50 if n >= 15 else 200)
 
         # Estimate breakdown
         computation = get_rust_time(n)
@@ -77,77 +121,81 @@ def main():
 
         print(f"  → Overhead: {overhead*1e3:.2f} ms ({pct:.1f}%), "
               f"Computation: {computation*1e3:.2f} ms ({100-pct:.1f}%)")
+        ghz_times[n] = (t, computation)
 
     print("\n5. WHAT CAUSES THE OVERHEAD?")
     print("-" * 70)
     print("""
-Sources of overhead in Python→Rust calls:
-
-1. FFI Boundary Crossing (~5-20 µs/call)
-   - Switching between Python and Rust execution contexts
-   - Argument marshaling (Python int → Rust usize)
-   - Return value marshaling (Rust QReg → Python PyQReg)
-
-2. Python Object Management (~10-50 µs/operation)
-   - Allocating PyQReg wrapper objects
-   - Reference counting (increment/decrement)
-   - Borrow checking (borrow_mut) across the boundary
-
-3. GIL (Global Interpreter Lock) (~10-30% overhead)
-   - Held during all Rust operations
-   - Prevents true parallelism with Python threads
-   - Adds synchronization overhead even in single-threaded code
-
-4. Lack of Cross-Language Optimization (major!)
-   - Rust compiler can't inline Python→Rust calls
-   - Can't optimize across the boundary
-   - Each gate is a separate, opaque function call
-   - No link-time optimization (LTO) across languages
-
-5. Cache Effects (~5-15% for large states)
-   - Crossing language boundary affects CPU caching
-   - Python's memory allocator vs Rust's allocator
-   - Less predictable memory access patterns
-
-Native Rust avoids ALL of these by:
-- Zero FFI calls (all Rust)
-- Zero Python object management
-- No GIL
-- Aggressive inlining and optimization
-- Better cache locality
+Sources of overhead in Python→Rust calls (sections 1-3 measure them):
+
+1. FFI Boundary Crossing (per call, section 3's per-gate cost)
+   - Method dispatch and argument conversion (Python int → Rust usize)
+   - Paid once per gate when chaining q.H(0).CNOT(0, 1)...
+   - apply_circuit() and Circuit.run() pay it once per circuit
+
+2. Python Object Management (small and constant)
+   - Gate methods mutate the register in place and return the same
+     Python object: no new PyQReg wrapper and no copy of the state
+   - One mutable borrow check per call
+   - Allocation only where asked for: ket(), copy() (section 2)
+
+3. GIL Handling (large states only)
+   - Released for registers of 10+ qubits, so Rayon gets every core
+   - No clone of the state around the release; the borrow is held instead
+   - Kept for smaller registers, where releasing it costs more than the gate
+
+4. No Optimization Across Gate Calls
+   - Chained methods run one gate, and one sweep of the state, per call
+   - apply_circuit() and Circuit first fuse the whole gate list: dense
+     gates on up to 4 qubits, X/Z runs as single mask passes, and
+     cancelling or identity gates dropped before they reach the state
+
+What remains on the native side (section 4's "Computation") is the
+state-vector sweeps themselves: memory bandwidth, not FFI.
 """)
 
     print("\n" + "=" * 70)
     print("CONCLUSION")
     print("=" * 70)
+    n = max(ghz_times)
+    t, computation = ghz_times[n]
+    overhead = t - computation
+    pct = (overhead / t) * 100
     print(f"""
-For the 22-qubit GHZ benchmark:
-  • Native Rust:   66.6 ms  ← fully optimized, zero overhead
-  • Python→Rust: 1360.0 ms  ← 1293 ms overhead (95% of total time!)
-  • Overhead breakdown:
-      - 23 FFI calls × ~20 µs ≈ 0.5 ms
-      - Python object management ≈ 1-5 ms
-      - GIL overhead ≈ 100-200 ms
-      - Lack of optimization ≈ 1000+ ms (the killer!)
-
-The 20x difference is mostly due to the Rust compiler being unable to
-optimize across the Python/Rust boundary. Each gate operation is a
-separate, opaque function call that can't be inlined or optimized away.
-
-Despite this, Python→Rust is still 12-16x faster than pure Python
-because the actual matrix operations are in optimized Rust code!
+For the {n}-qubit GHZ benchmark (section 4, via apply_circuit):
+  • Native Rust:  {computation*1e3:8.2f} ms
+  • Python→Rust:  {t*1e3:8.2f} ms  ({overhead*1e3:.2f} ms overhead, {pct:.1f}% of total)
+
+Each gate method call costs ~{per_gate*1e6:.2f} µs (section 3), so a single
+apply_circuit() call is negligible next to the gate sweeps once states are
+large. Chaining gate methods one by one pays that cost per gate and loses
+fusion; batch gates with apply_circuit() or Circuit for large circuits.
 """)
 
 def create_ghz(n):
     """Create n-qubit GHZ state."""
-    q = ket('0' * n).H(0)
-    for i in range(n - 1):
-        q = q.CNOT(i, i + 1)
-    return q
+    return ghz(n)
+
+def create_ghz_gates(n):
+    """Create n-qubit GHZ state by running H + CNOT chain (the honest benchmark)."""
+    ops = [('H', 0)] + [('CNOT', i, i + 1) for i in range(n - 1)]
+    return ket('0' * n).apply_circuit(ops)
 
 def get_rust_time(n):
-    """Estimate pure Rust time based on scaling."""
-    # From our benchmarks:
+    """Native Rust time for GHZ-n, from the Criterion bench if it has been run.
+
+    `cargo bench --bench ghz` writes target/criterion/ghz/<n>/new/estimates.json
+    (times in ns). Falls back to older recorded numbers when it hasn't.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'target', 'criterion', 'ghz', str(n), 'new', 'estimates.json')
+    try:
+        with open(path) as f:
+            return json.load(f)['mean']['point_estimate'] * 1e-9
+    except (OSError, KeyError, ValueError):
+        pass
+
+    # From our benchmarks (run `cargo bench --bench ghz` to refresh):
     rust_times = {
         10: 0.34e-3,
         15: 0.96e-3,
@@ -3,10 +3,11 @@
 
 use ndarray::{array, Array1, Array2};
 use num_complex::Complex64;
-use rand::Rng;
+use rand::rngs::StdRng;
+use rand::{Rng, SeedableRng};
 use rayon::prelude::*;
 use std::fmt;
-use std::ops::{Add, Mul, Sub};
+use std::ops::{Add, Mul, Neg, Sub};
 use std::sync::LazyLock;
 
 // ---- Thread-safe pointer wrapper for parallel mutation ----
@@ -29,6 +30,287 @@ impl<T: Copy> SendPtr<T> {
     }
 }
 
+// ---- SIMD Kernels ----
+
+mod simd;
+
+/// Single-qubit gate kernel for this CPU, selected on first use.
+static KERNEL_1Q: LazyLock<simd::Kernel1q> = LazyLock::new(simd::select_kernel_1q);
+
+/// Amplitudes handled per rayon task by the streaming gate kernels: 256 KB of
+/// complex128, so a task's tile (both halves of every pair) stays in L2.
+const TILE: usize = 1 << 14;
+
+/// Split `v` into runs of amplitude pairs whose indices differ only in bit
+/// `target`, distributing them across rayon tasks. `adjacent` gets tiles of
+/// (v[2k], v[2k + 1]) pairs when `target` is 0; otherwise `strided` gets
+/// equal-length (lo, hi) runs where lo[k] pairs with hi[k].
+fn for_each_pair_run<T, A, S>(v: &mut [T], target: usize, adjacent: A, strided: S)
+where
+    T: Send,
+    A: Fn(&mut [T]) + Sync + Send,
+    S: Fn(&mut [T], &mut [T]) + Sync + Send,
+{
+    let stride = 1 << target;
+    if stride == 1 {
+        v.par_chunks_mut(TILE).for_each(adjacent);
+    } else if 2 * stride <= TILE {
+        // Each tile holds whole blocks of [lo run | hi run]
+        v.par_chunks_mut(TILE).for_each(|tile| {
+            for block in tile.chunks_exact_mut(2 * stride) {
+                let (lo, hi) = block.split_at_mut(stride);
+                strided(lo, hi);
+            }
+        });
+    } else {
+        // Runs are longer than a tile: split each run pair across tasks
+        for block in v.chunks_exact_mut(2 * stride) {
+            let (lo, hi) = block.split_at_mut(stride);
+            lo.par_chunks_mut(TILE / 2)
+                .zip(hi.par_chunks_mut(TILE / 2))
+                .for_each(|(l, h)| strided(l, h));
+        }
+    }
+}
+
+/// Split `v` into quadruples of equal-length runs (a, b, c, d) whose indices
+/// differ only in bits `low` < `high`: a has both bits 0, b has `low` set,
+/// c has `high` set and d has both. Tiles are distributed across rayon tasks
+/// as in `for_each_pair_run`; bits too high for a tile fall back to splitting
+/// the runs themselves.
+fn for_each_quad_run<T, F>(v: &mut [T], low: usize, high: usize, f: F)
+where
+    T: Send,
+    F: Fn(&mut [T], &mut [T], &mut [T], &mut [T]) + Sync + Send,
+{
+    let (ls, hs) = (1usize << low, 1usize << high);
+    // Quadruples of runs inside a pair of `high` halves of equal length
+    let quads = |h0: &mut [T], h1: &mut [T]| {
+        for (b0, b1) in h0.chunks_exact_mut(2 * ls).zip(h1.chunks_exact_mut(2 * ls)) {
+            let (a, b) = b0.split_at_mut(ls);
+            let (c, d) = b1.split_at_mut(ls);
+            f(a, b, c, d);
+        }
+    };
+    if 2 * hs <= TILE {
+        v.par_chunks_mut(TILE).for_each(|tile| {
+            for block in tile.chunks_exact_mut(2 * hs) {
+                let (h0, h1) = block.split_at_mut(hs);
+                quads(h0, h1);
+            }
+        });
+    } else if 2 * ls <= TILE / 2 {
+        // Big stride on `high` only: tile each half and pair tiles across
+        for block in v.chunks_exact_mut(2 * hs) {
+            let (h0, h1) = block.split_at_mut(hs);
+            h0.par_chunks_mut(TILE / 2)
+                .zip(h1.par_chunks_mut(TILE / 2))
+                .for_each(|(x0, x1)| quads(x0, x1));
+        }
+    } else {
+        // Both strides exceed a tile: split all four runs across tasks
+        for block in v.chunks_exact_mut(2 * hs) {
+            let (h0, h1) = block.split_at_mut(hs);
+            for (b0, b1) in h0.chunks_exact_mut(2 * ls).zip(h1.chunks_exact_mut(2 * ls)) {
+                let (a, b) = b0.split_at_mut(ls);
+                let (c, d) = b1.split_at_mut(ls);
+                a.par_chunks_mut(TILE / 4)
+                    .zip(b.par_chunks_mut(TILE / 4))
+                    .zip(c.par_chunks_mut(TILE / 4))
+                    .zip(d.par_chunks_mut(TILE / 4))
+                    .for_each(|(((a, b), c), d)| f(a, b, c, d));
+            }
+        }
+    }
+}
+
+// ---- Generic Kernels ----
+
+/// Amplitude types the generic gate kernels run on: `Complex64` for `QReg`
+/// and `Complex32` for `QReg32`.
+trait Amplitude:
+    Copy + Default + Send + Sync + Add<Output = Self> + Mul<Output = Self> + Neg<Output = Self>
+{
+}
+
+impl<A> Amplitude for A where
+    A: Copy + Default + Send + Sync + Add<Output = A> + Mul<Output = A> + Neg<Output = A>
+{
+}
+
+/// Apply a single-qubit gate [m00, m01, m10, m11] with plain scalar loops,
+/// which the compiler can vectorize over the contiguous runs.
+fn pair_kernel<A: Amplitude>(v: &mut [A], m: [A; 4], target: usize) {
+    for_each_pair_run(
+        v,
+        target,
+        |tile| {
+            for p in tile.chunks_exact_mut(2) {
+                let (x, y) = (p[0], p[1]);
+                p[0] = m[0] * x + m[1] * y;
+                p[1] = m[2] * x + m[3] * y;
+            }
+        },
+        |lo, hi| {
+            for (a, b) in lo.iter_mut().zip(hi.iter_mut()) {
+                let (x, y) = (*a, *b);
+                *a = m[0] * x + m[1] * y;
+                *b = m[2] * x + m[3] * y;
+            }
+        },
+    );
+}
+
+/// Apply a 4x4 gate indexed by 2 * control_bit + target_bit.
+fn quad_kernel<A: Amplitude>(v: &mut [A], mv: [[A; 4]; 4], control: usize, target: usize) {
+    // Runs come out ordered by (high bit, low bit); the matrix wants
+    // (control bit, target bit), which swaps b and c if control is low.
+    let (low, high) = (control.min(target), control.max(target));
+    let control_low = control < target;
+    for_each_quad_run(v, low, high, |a, b, c, d| {
+        let (r1, r2) = if control_low { (c, b) } else { (b, c) };
+        for k in 0..a.len() {
+            let q = [a[k], r1[k], r2[k], d[k]];
+            let row = |r: &[A; 4]| r[0] * q[0] + r[1] * q[1] + r[2] * q[2] + r[3] * q[3];
+            a[k] = row(&mv[0]);
+            r1[k] = row(&mv[1]);
+            r2[k] = row(&mv[2]);
+            d[k] = row(&mv[3]);
+        }
+    });
+}
+
+/// Apply CNOT as a pure permutation: swap the control=1 runs with target 0
+/// and target 1, with no arithmetic on the amplitudes.
+fn cnot_kernel<T: Send>(v: &mut [T], control: usize, target: usize) {
+    let (low, high) = (control.min(target), control.max(target));
+    let control_low = control < target;
+    for_each_quad_run(v, low, high, |_, b, c, d| {
+        if control_low {
+            b.swap_with_slice(d);
+        } else {
+            c.swap_with_slice(d);
+        }
+    });
+}
+
+/// Apply a dense gate on distinct `qubits` (see `QReg::applynq`).
+fn dense_kernel<A: Amplitude>(v: &mut [A], m: &[A], qubits: &[usize]) {
+    let k = qubits.len();
+    let dim = 1 << k;
+    let mut sorted = qubits.to_vec();
+    sorted.sort_unstable();
+    // offsets[r] is the state-vector offset of local basis state r
+    let offsets: Vec<usize> = (0..dim)
+        .map(|r| (0..k).map(|j| ((r >> j) & 1) << qubits[j]).sum())
+        .collect();
+    let groups = v.len() >> k;
+    let ptr = SendPtr(v.as_mut_ptr());
+    // SAFETY: Each group g expands to a distinct base index with zeros at
+    // every gate qubit; base + offsets[r] therefore never overlaps between
+    // different groups.
+    (0..groups).into_par_iter().for_each(move |g| {
+        let mut base = g;
+        for &q in &sorted {
+            base = (base & ((1 << q) - 1)) | ((base >> q) << (q + 1));
+        }
+        let mut amps = [A::default(); 1 << MAX_FUSED_QUBITS];
+        for r in 0..dim {
+            amps[r] = unsafe { ptr.read(base + offsets[r]) };
+        }
+        for r in 0..dim {
+            let row = &m[r * dim..(r + 1) * dim];
+            let val = row
+                .iter()
+                .zip(&amps[..dim])
+                .fold(A::default(), |acc, (&a, &b)| acc + a * b);
+            unsafe { ptr.write(base + offsets[r], val) };
+        }
+    });
+}
+
+/// Apply a dense gate whose row r has its single nonzero entry `phase` in
+/// column `src`, given as `perm[r] = (src, phase)`: a gather within each
+/// group of amplitudes instead of a matrix-vector product.
+fn perm_kernel<A: Amplitude>(v: &mut [A], perm: &[(usize, A)], qubits: &[usize]) {
+    let k = qubits.len();
+    let dim = 1 << k;
+    let mut sorted = qubits.to_vec();
+    sorted.sort_unstable();
+    let offsets: Vec<usize> = (0..dim)
+        .map(|r| (0..k).map(|j| ((r >> j) & 1) << qubits[j]).sum())
+        .collect();
+    let groups = v.len() >> k;
+    let ptr = SendPtr(v.as_mut_ptr());
+    // SAFETY: as in `dense_kernel`, groups touch disjoint index sets.
+    (0..groups).into_par_iter().for_each(move |g| {
+        let mut base = g;
+        for &q in &sorted {
+            base = (base & ((1 << q) - 1)) | ((base >> q) << (q + 1));
+        }
+        let mut amps = [A::default(); 1 << MAX_FUSED_QUBITS];
+        for r in 0..dim {
+            amps[r] = unsafe { ptr.read(base + offsets[r]) };
+        }
+        for (r, &(src, phase)) in perm.iter().enumerate() {
+            unsafe { ptr.write(base + offsets[r], phase * amps[src]) };
+        }
+    });
+}
+
+/// Apply X to every qubit in the nonzero `mask`.
+fn xmask_kernel<A: Amplitude>(v: &mut [A], mask: usize) {
+    let len = v.len();
+    let high = usize::BITS - 1 - mask.leading_zeros();
+    let ptr = SendPtr(v.as_mut_ptr());
+    // SAFETY: i has a 0 at the highest bit of the mask and j = i ^ mask a
+    // 1, so the (i, j) pairs are disjoint across iterations.
+    (0..len / 2).into_par_iter().for_each(move |g| {
+        let i = (g & ((1 << high) - 1)) | ((g >> high) << (high + 1));
+        let j = i ^ mask;
+        unsafe {
+            let (qi, qj) = (ptr.read(i), ptr.read(j));
+            ptr.write(i, qj);
+            ptr.write(j, qi);
+        }
+    });
+}
+
+/// Apply Z to every qubit in `mask`.
+fn zmask_kernel<A: Amplitude>(v: &mut [A], mask: usize) {
+    v.par_chunks_mut(TILE).enumerate().for_each(|(t, tile)| {
+        for (k, amp) in tile.iter_mut().enumerate() {
+            if ((t * TILE + k) & mask).count_ones() & 1 == 1 {
+                *amp = -*amp;
+            }
+        }
+    });
+}
+
+/// Shots drawn per rayon task (and per independently seeded RNG) in `sample()`.
+const SHOTS_PER_TASK: usize = 1 << 10;
+
+/// Amplitudes closer than this (in modulus) compare equal in `isclose()`.
+const ISCLOSE_TOL: f64 = 1e-5;
+
+/// Whether `a` and `b` agree element-wise to within `ISCLOSE_TOL`, where
+/// `dist_sqr` gives the squared distance of a pair (no sqrt per element).
+/// Above one tile the scan runs in parallel and ends as soon as any thread
+/// finds a mismatch (`find_any`).
+fn all_close<A, B, D>(a: &[A], b: &[B], dist_sqr: D) -> bool
+where
+    A: Copy + Sync,
+    B: Copy + Sync,
+    D: Fn(A, B) -> f64 + Sync,
+{
+    let far = |(&x, &y): (&A, &B)| dist_sqr(x, y) >= ISCLOSE_TOL * ISCLOSE_TOL;
+    if a.len() <= TILE {
+        !a.iter().zip(b).any(far)
+    } else {
+        a.par_iter().zip(b).find_any(|&pair| far(pair)).is_none()
+    }
+}
+
 // ---- Complex Constants ----
 
 const ZERO: Complex64 = Complex64::new(0.0, 0.0);
@@ -96,6 +378,304 @@ pub static CPHASE_GATE: LazyLock<Array2<Complex64>> = LazyLock::new(|| {
     ]
 });
 
+// ---- Circuit Operations ----
+
+/// A single gate in a circuit, as consumed by `QReg::apply_circuit`.
+#[derive(Copy, Clone, Debug, PartialEq)]
+pub enum Op {
+    X(usize),
+    Y(usize),
+    Z(usize),
+    H(usize),
+    S(usize),
+    /// Controlled-NOT as (control, target)
+    Cnot(usize, usize),
+    /// Controlled-phase as (control, target)
+    Cphase(usize, usize),
+}
+
+// ---- Gate Fusion ----
+
+/// Largest gate `fuse()` will build (64x64 matrices).
+pub const MAX_FUSED_QUBITS: usize = 6;
+
+/// A dense gate produced by the fusion pass.
+///
+/// `matrix` is a row-major 2^k x 2^k unitary over `qubits`, where bit j of a
+/// row or column index is the state of `qubits[j]`.
+#[derive(Clone, Debug)]
+pub struct FusedGate {
+    pub qubits: Vec<usize>,
+    pub matrix: Vec<Complex64>,
+}
+
+impl FusedGate {
+    fn from_array(qubits: Vec<usize>, m: &Array2<Complex64>) -> Self {
+        let dim = 1 << qubits.len();
+        let matrix = (0..dim * dim).map(|i| m[[i / dim, i % dim]]).collect();
+        FusedGate { qubits, matrix }
+    }
+
+    /// This gate's matrix acting on `support`, which must contain `self.qubits`.
+    fn expand(&self, support: &[usize]) -> Vec<Complex64> {
+        let pos: Vec<usize> = self
+            .qubits
+            .iter()
+            .map(|q| support.iter().position(|s| s == q).unwrap())
+            .collect();
+        let own_mask: usize = pos.iter().map(|&p| 1 << p).sum();
+        let local = |r: usize| -> usize {
+            pos.iter().enumerate().map(|(j, &p)| ((r >> p) & 1) << j).sum()
+        };
+        let dim = 1 << support.len();
+        let gdim = 1 << self.qubits.len();
+        let mut out = vec![ZERO; dim * dim];
+        for r in 0..dim {
+            for c in 0..dim {
+                if r & !own_mask == c & !own_mask {
+                    out[r * dim + c] = self.matrix[local(r) * gdim + local(c)];
+                }
+            }
+        }
+        out
+    }
+
+    /// Whether this is a bare CNOT, laid out as by `Op::to_gate`, which
+    /// the permutation kernel can apply instead of the matrix.
+    fn is_cnot(&self) -> bool {
+        const PERM: [usize; 4] = [0, 1, 3, 2];
+        self.qubits.len() == 2
+            && self
+                .matrix
+                .iter()
+                .enumerate()
+                .all(|(i, &x)| x == if PERM[i / 4] == i % 4 { ONE } else { ZERO })
+    }
+
+    /// The matrix as `perm[r] = (src, phase)` if every row has exactly one
+    /// nonzero entry and no two rows share a column (a permutation with
+    /// phases, such as a fused CNOT chain), for `perm_kernel`.
+    fn permutation(&self) -> Option<Vec<(usize, Complex64)>> {
+        let dim = 1 << self.qubits.len();
+        let mut seen = vec![false; dim];
+        let mut perm = Vec::with_capacity(dim);
+        for row in self.matrix.chunks_exact(dim) {
+            let mut nonzero = row.iter().enumerate().filter(|&(_, &x)| x != ZERO);
+            let (src, &phase) = nonzero.next()?;
+            if nonzero.next().is_some() || seen[src] {
+                return None;
+            }
+            seen[src] = true;
+            perm.push((src, phase));
+        }
+        Some(perm)
+    }
+
+    /// Whether the matrix is the identity to within 1e-12 per entry.
+    fn is_identity(&self) -> bool {
+        let dim = 1 << self.qubits.len();
+        self.matrix.iter().enumerate().all(|(i, x)| {
+            let id = if i / dim == i % dim { ONE } else { ZERO };
+            (x - id).norm() < 1e-12
+        })
+    }
+
+    /// Combine with `next` (applied after `self`) into a single gate.
+    fn then(&self, next: &FusedGate) -> FusedGate {
+        let mut qubits = self.qubits.clone();
+        for &q in &next.qubits {
+            if !qubits.contains(&q) {
+                qubits.push(q);
+            }
+        }
+        let a = self.expand(&qubits);
+        let b = next.expand(&qubits);
+        let dim = 1 << qubits.len();
+        let mut matrix = vec![ZERO; dim * dim];
+        for r in 0..dim {
+            for k in 0..dim {
+                let brk = b[r * dim + k];
+                if brk == ZERO {
+                    continue;
+                }
+                for c in 0..dim {
+                    matrix[r * dim + c] += brk * a[k * dim + c];
+                }
+            }
+        }
+        FusedGate { qubits, matrix }
+    }
+}
+
+impl Op {
+    /// This op as a dense gate. Two-qubit gates list the target first so
+    /// their matrices keep the `apply2q` index order.
+    fn to_gate(self) -> FusedGate {
+        match self {
+            Op::X(t) => FusedGate::from_array(vec![t], &X_GATE),
+            Op::Y(t) => FusedGate::from_array(vec![t], &Y_GATE),
+            Op::Z(t) => FusedGate::from_array(vec![t], &Z_GATE),
+            Op::H(t) => FusedGate::from_array(vec![t], &H_GATE),
+            Op::S(t) => FusedGate::from_array(vec![t], &S_GATE),
+            Op::Cnot(c, t) => FusedGate::from_array(vec![t, c], &CNOT_GATE),
+            Op::Cphase(c, t) => FusedGate::from_array(vec![t, c], &CPHASE_GATE),
+        }
+    }
+}
+
+/// Number of distinct qubits in the union of `a` and `b`.
+fn support_size(a: &[usize], b: &[usize]) -> usize {
+    a.len() + b.iter().filter(|q| !a.contains(q)).count()
+}
+
+/// A step of a fused circuit.
+#[derive(Clone, Debug)]
+pub enum FusedOp {
+    /// Dense gate on a few qubits
+    Gate(FusedGate),
+    /// X on every qubit set in the mask, applied in one pass
+    XMask(usize),
+    /// Z on every qubit set in the mask, applied in one pass
+    ZMask(usize),
+}
+
+/// If `ops` starts with two or more consecutive X gates (or Z gates), return
+/// the run length and the equivalent mask op. Repeated qubits cancel.
+fn pauli_run(ops: &[Op]) -> Option<(usize, Option<FusedOp>)> {
+    // An out-of-range qubit ends the run instead of wrapping the shift, so
+    // it reaches the dense path, which checks it against the register
+    let one_hot = |t: usize| u32::try_from(t).ok().and_then(|t| 1usize.checked_shl(t));
+    let bit = |op: &Op, want_x: bool| match *op {
+        Op::X(t) if want_x => one_hot(t),
+        Op::Z(t) if !want_x => one_hot(t),
+        _ => None,
+    };
+    let want_x = matches!(ops.first()?, Op::X(_));
+    let bits: Vec<usize> = ops.iter().map_while(|op| bit(op, want_x)).collect();
+    if bits.len() < 2 {
+        return None;
+    }
+    let mask = bits.iter().fold(0, |m, b| m ^ b);
+    let op = match mask {
+        0 => None,
+        _ if want_x => Some(FusedOp::XMask(mask)),
+        _ => Some(FusedOp::ZMask(mask)),
+    };
+    Some((bits.len(), op))
+}
+
+/// Drop adjacent pairs of identical self-inverse ops (H H, CNOT CNOT, ...).
+/// Cancellations cascade, so H X X H disappears entirely.
+fn cancel_involutions(ops: &[Op]) -> Vec<Op> {
+    let mut kept: Vec<Op> = Vec::with_capacity(ops.len());
+    for &op in ops {
+        if !matches!(op, Op::S(_)) && kept.last() == Some(&op) {
+            kept.pop();
+        } else {
+            kept.push(op);
+        }
+    }
+    kept
+}
+
+/// Fuse a circuit into fewer, larger operations.
+///
+/// Adjacent identical self-inverse gates cancel first, and any fused gate
+/// that works out to the identity is dropped. Runs of consecutive X (or Z)
+/// gates become a single `XMask` (`ZMask`). The gates between them go
+/// through qsim-style two-pass fusion: pass 1 absorbs runs of single-qubit
+/// gates into the next multi-qubit gate on the same qubit, leaving one
+/// combined gate per qubit for any remainder; pass 2 greedily merges
+/// consecutive gates while their combined support stays within
+/// `max_fused_qubits`.
+pub fn fuse(ops: &[Op], max_fused_qubits: usize) -> Vec<FusedOp> {
+    assert!(
+        (1..=MAX_FUSED_QUBITS).contains(&max_fused_qubits),
+        "max_fused_qubits must be in [1, {MAX_FUSED_QUBITS}], got {max_fused_qubits}"
+    );
+
+    let ops = &cancel_involutions(ops)[..];
+    let mut fused = Vec::new();
+    let mut start = 0;
+    let mut i = 0;
+    while i < ops.len() {
+        if let Some((len, mask_op)) = pauli_run(&ops[i..]) {
+            fused.extend(fuse_gates(&ops[start..i], max_fused_qubits).into_iter().map(FusedOp::Gate));
+            fused.extend(mask_op);
+            i += len;
+            start = i;
+        } else {
+            i += 1;
+        }
+    }
+    fused.extend(fuse_gates(&ops[start..], max_fused_qubits).into_iter().map(FusedOp::Gate));
+    fused
+}
+
+/// Two-pass fusion of `ops` into dense gates on at most `max_fused_qubits`.
+fn fuse_gates(ops: &[Op], max_fused_qubits: usize) -> Vec<FusedGate> {
+    // Pass 1: single-qubit gates commute with everything on other qubits, so
+    // hold them per qubit until a multi-qubit gate touches that qubit.
+    let mut pending: Vec<Option<FusedGate>> = Vec::new();
+    let mut absorbed = Vec::with_capacity(ops.len());
+    for &op in ops {
+        let gate = op.to_gate();
+        let top = gate.qubits.iter().max().unwrap() + 1;
+        if pending.len() < top {
+            pending.resize(top, None);
+        }
+        if let [t] = gate.qubits[..] {
+            let run = match pending[t].take() {
+                Some(p) => p.then(&gate),
+                None => gate,
+            };
+            // A run that multiplies out to the identity (S S S S) is dropped
+            pending[t] = (!run.is_identity()).then_some(run);
+        } else {
+            let mut before: Option<FusedGate> = None;
+            for &q in &gate.qubits {
+                if let Some(p) = pending[q].take() {
+                    before = Some(match before {
+                        Some(b) => b.then(&p),
+                        None => p,
+                    });
+                }
+            }
+            // A bare CNOT stays a swap; the held gates go ahead of it
+            match before {
+                Some(b) if gate.is_cnot() => absorbed.extend([b, gate]),
+                Some(b) => absorbed.push(b.then(&gate)),
+                None => absorbed.push(gate),
+            }
+        }
+    }
+    absorbed.extend(pending.into_iter().flatten());
+
+    // Pass 2: greedy forward scan over the absorbed gates. A bare CNOT only
+    // merges into a gate that already covers its qubits: swapping it in
+    // place is cheaper than the wider gate it would otherwise turn into.
+    let mut fused: Vec<FusedGate> = Vec::with_capacity(absorbed.len());
+    let covers =
+        |a: &FusedGate, b: &FusedGate| support_size(&a.qubits, &b.qubits) == a.qubits.len();
+    for gate in absorbed {
+        let merges = |acc: &FusedGate| {
+            support_size(&acc.qubits, &gate.qubits) <= max_fused_qubits
+                && (!gate.is_cnot() || covers(acc, &gate))
+                && (!acc.is_cnot() || covers(&gate, acc))
+        };
+        match fused.last_mut() {
+            Some(acc) if merges(acc) => {
+                *acc = acc.then(&gate);
+                if acc.is_identity() {
+                    fused.pop();
+                }
+            }
+            _ => fused.push(gate),
+        }
+    }
+    fused
+}
+
 // ---- Kronecker Product ----
 
 fn kron(a: &Array1<Complex64>, b: &Array1<Complex64>) -> Array1<Complex64> {
@@ -213,35 +793,34 @@ impl QReg {
 
     /// Apply a single-qubit gate matrix to the target qubit.
     pub fn apply1q(&mut self, m: &Array2<Complex64>, target: usize) -> &mut Self {
+        self.apply_matrix1q([m[[0, 0]], m[[0, 1]], m[[1, 0]], m[[1, 1]]], target)
+    }
+
+    /// Apply a single-qubit gate given as row-major entries [m00, m01, m10, m11].
+    fn apply_matrix1q(&mut self, m: [Complex64; 4], target: usize) -> &mut Self {
         assert!(
             target < self.n,
             "Invalid target qubit {target}. Must be in [0, {})",
             self.n
         );
-        let m00 = m[[0, 0]];
-        let m01 = m[[0, 1]];
-        let m10 = m[[1, 0]];
-        let m11 = m[[1, 1]];
-        let len = self.v.len();
-        let ptr = SendPtr(self.v.as_mut_ptr());
-        // SAFETY: Each (i, j) pair is unique and non-overlapping.
-        // For target bit b, pairs are (i, i|(1<<b)) for all i where bit b is 0.
-        // No two iterations touch the same array element.
-        (0..len).into_par_iter().for_each(move |i| {
-            let j = conjugate_index(i, target);
-            if i > j {
-                return;
-            }
-            unsafe {
-                let qi = ptr.read(i);
-                let qj = ptr.read(j);
-                if qi.norm() + qj.norm() < 1e-8 {
-                    return;
-                }
-                ptr.write(i, m00 * qi + m01 * qj);
-                ptr.write(j, m10 * qi + m11 * qj);
-            }
-        });
+        let kernel = *KERNEL_1Q;
+        if m.iter().all(|x| x.im == 0.0) {
+            // Real gates (H, X, Z) scale re and im parts independently
+            let mr = m.map(|x| x.re);
+            for_each_pair_run(
+                self.v.as_slice_mut().unwrap(),
+                target,
+                |tile| (kernel.adjacent_real)(tile, &mr),
+                |lo, hi| (kernel.strided_real)(lo, hi, &mr),
+            );
+        } else {
+            for_each_pair_run(
+                self.v.as_slice_mut().unwrap(),
+                target,
+                |tile| (kernel.adjacent)(tile, &m),
+                |lo, hi| (kernel.strided)(lo, hi, &m),
+            );
+        }
         self
     }
 
@@ -252,6 +831,36 @@ impl QReg {
         control: usize,
         target: usize,
     ) -> &mut Self {
+        let mv: [[Complex64; 4]; 4] = [
+            [m[[0, 0]], m[[0, 1]], m[[0, 2]], m[[0, 3]]],
+            [m[[1, 0]], m[[1, 1]], m[[1, 2]], m[[1, 3]]],
+            [m[[2, 0]], m[[2, 1]], m[[2, 2]], m[[2, 3]]],
+            [m[[3, 0]], m[[3, 1]], m[[3, 2]], m[[3, 3]]],
+        ];
+        self.apply_matrix2q(mv, control, target)
+    }
+
+    /// Apply a two-qubit gate given as a 4x4 array. The row/column index is
+    /// 2 * control_bit + target_bit, as in `CNOT_GATE`.
+    fn apply_matrix2q(
+        &mut self,
+        mv: [[Complex64; 4]; 4],
+        control: usize,
+        target: usize,
+    ) -> &mut Self {
+        self.check_pair(control, target);
+        quad_kernel(self.v.as_slice_mut().unwrap(), mv, control, target);
+        self
+    }
+
+    /// Apply CNOT by swapping amplitudes instead of multiplying by the matrix.
+    pub fn apply_cnot(&mut self, control: usize, target: usize) -> &mut Self {
+        self.check_pair(control, target);
+        cnot_kernel(self.v.as_slice_mut().unwrap(), control, target);
+        self
+    }
+
+    fn check_pair(&self, control: usize, target: usize) {
         assert!(
             control < self.n,
             "Invalid control qubit {control}. Must be in [0, {})",
@@ -263,73 +872,136 @@ impl QReg {
             self.n
         );
         assert!(control != target, "Control and target must be different qubits");
+    }
 
-        let mv: [[Complex64; 4]; 4] = [
-            [m[[0, 0]], m[[0, 1]], m[[0, 2]], m[[0, 3]]],
-            [m[[1, 0]], m[[1, 1]], m[[1, 2]], m[[1, 3]]],
-            [m[[2, 0]], m[[2, 1]], m[[2, 2]], m[[2, 3]]],
-            [m[[3, 0]], m[[3, 1]], m[[3, 2]], m[[3, 3]]],
-        ];
+    /// Validate the qubits of a k-qubit gate (see `applynq`).
+    fn check_gate_qubits(&self, qubits: &[usize]) {
+        let k = qubits.len();
+        assert!(
+            (1..=MAX_FUSED_QUBITS).contains(&k),
+            "Gate must act on 1 to {MAX_FUSED_QUBITS} qubits, got {k}"
+        );
+        for &q in qubits {
+            assert!(q < self.n, "Invalid target qubit {q}. Must be in [0, {})", self.n);
+        }
+        let mut sorted = qubits.to_vec();
+        sorted.sort_unstable();
+        sorted.dedup();
+        assert!(sorted.len() == k, "Gate qubits must be different");
+    }
+
+    /// Apply a dense k-qubit gate in-place. `m` is a row-major 2^k x 2^k
+    /// matrix where bit j of a row/column index is the state of `qubits[j]`.
+    pub fn applynq(&mut self, m: &[Complex64], qubits: &[usize]) -> &mut Self {
+        self.check_gate_qubits(qubits);
+        let dim = 1 << qubits.len();
+        assert_eq!(m.len(), dim * dim, "Gate matrix must be {dim}x{dim}");
+
+        dense_kernel(self.v.as_slice_mut().unwrap(), m, qubits);
+        self
+    }
+
+    /// Apply X to every qubit set in `mask` in a single pass.
+    pub fn apply_xmask(&mut self, mask: usize) -> &mut Self {
         let len = self.v.len();
-        let ptr = SendPtr(self.v.as_mut_ptr());
-        // SAFETY: Each (i, j, k, l) group is unique and non-overlapping.
-        // The two bit positions (control, target) partition all 2^n indices
-        // into groups of 4 that don't overlap between iterations.
-        (0..len).into_par_iter().for_each(move |i| {
-            let j = conjugate_index(i, target);
-            if i > j {
-                return;
-            }
-            let k = conjugate_index(i, control);
-            if i > k {
-                return;
-            }
-            let l = conjugate_index(j, control);
-
-            unsafe {
-                let (qi, qj, qk, ql) = (
-                    ptr.read(i),
-                    ptr.read(j),
-                    ptr.read(k),
-                    ptr.read(l),
-                );
-                if qi.norm() + qj.norm() + qk.norm() + ql.norm() < 1e-8 {
-                    return;
+        assert!(mask < len, "X mask {mask:#b} has qubits outside [0, {})", self.n);
+        if mask == 0 {
+            return self;
+        }
+        xmask_kernel(self.v.as_slice_mut().unwrap(), mask);
+        self
+    }
+
+    /// Apply Z to every qubit set in `mask` in a single pass.
+    pub fn apply_zmask(&mut self, mask: usize) -> &mut Self {
+        assert!(mask < self.v.len(), "Z mask {mask:#b} has qubits outside [0, {})", self.n);
+        if mask == 0 {
+            return self;
+        }
+        zmask_kernel(self.v.as_slice_mut().unwrap(), mask);
+        self
+    }
+
+    /// Apply a step of a fused circuit in-place.
+    pub fn apply_fused(&mut self, op: &FusedOp) -> &mut Self {
+        match op {
+            FusedOp::Gate(gate) => self.apply_gate(gate),
+            FusedOp::XMask(mask) => self.apply_xmask(*mask),
+            FusedOp::ZMask(mask) => self.apply_zmask(*mask),
+        }
+    }
+
+    /// Apply a dense gate produced by `fuse()` in-place.
+    pub fn apply_gate(&mut self, gate: &FusedGate) -> &mut Self {
+        let m = &gate.matrix;
+        match gate.qubits[..] {
+            [t] => self.apply_matrix1q([m[0], m[1], m[2], m[3]], t),
+            [t, c] if gate.is_cnot() => self.apply_cnot(c, t),
+            [t, c] => self.apply_matrix2q(
+                [
+                    [m[0], m[1], m[2], m[3]],
+                    [m[4], m[5], m[6], m[7]],
+                    [m[8], m[9], m[10], m[11]],
+                    [m[12], m[13], m[14], m[15]],
+                ],
+                c,
+                t,
+            ),
+            _ => match gate.permutation() {
+                Some(perm) => {
+                    self.check_gate_qubits(&gate.qubits);
+                    perm_kernel(self.v.as_slice_mut().unwrap(), &perm, &gate.qubits);
+                    self
                 }
+                None => self.applynq(m, &gate.qubits),
+            },
+        }
+    }
 
-                ptr.write(i,
-                    mv[0][0] * qi + mv[0][1] * qj + mv[0][2] * qk + mv[0][3] * ql);
-                ptr.write(j,
-                    mv[1][0] * qi + mv[1][1] * qj + mv[1][2] * qk + mv[1][3] * ql);
-                ptr.write(k,
-                    mv[2][0] * qi + mv[2][1] * qj + mv[2][2] * qk + mv[2][3] * ql);
-                ptr.write(l,
-                    mv[3][0] * qi + mv[3][1] * qj + mv[3][2] * qk + mv[3][3] * ql);
-            }
-        });
+    /// Apply a single circuit operation in-place.
+    pub fn apply_op(&mut self, op: Op) -> &mut Self {
+        match op {
+            Op::X(t) => self.apply1q(&X_GATE, t),
+            Op::Y(t) => self.apply1q(&Y_GATE, t),
+            Op::Z(t) => self.apply1q(&Z_GATE, t),
+            Op::H(t) => self.apply1q(&H_GATE, t),
+            Op::S(t) => self.apply1q(&S_GATE, t),
+            Op::Cnot(c, t) => self.apply_cnot(c, t),
+            Op::Cphase(c, t) => self.apply2q(&CPHASE_GATE, c, t),
+        }
+    }
+
+    /// Apply a sequence of circuit operations in-place, in order.
+    pub fn apply_circuit(&mut self, ops: &[Op]) -> &mut Self {
+        for &op in ops {
+            self.apply_op(op);
+        }
+        self
+    }
+
+    /// Apply a fused circuit (see `fuse()`) in-place, in order.
+    pub fn apply_fused_circuit(&mut self, ops: &[FusedOp]) -> &mut Self {
+        for op in ops {
+            self.apply_fused(op);
+        }
         self
     }
 
     /// Check if this quantum state is close to another.
     pub fn isclose(&self, other: &QReg) -> bool {
-        if self.v.len() != other.v.len() {
-            return false;
-        }
-        self.v
-            .iter()
-            .zip(other.v.iter())
-            .all(|(a, b)| (a - b).norm() < 1e-5)
+        self.isclose_complex(other.v.as_slice().unwrap())
     }
 
     /// Check if this quantum state is close to a slice of f64 values (treated as real).
     pub fn isclose_slice(&self, other: &[f64]) -> bool {
-        if self.v.len() != other.len() {
-            return false;
-        }
-        self.v
-            .iter()
-            .zip(other.iter())
-            .all(|(a, b)| (a - b).norm() < 1e-5)
+        self.v.len() == other.len()
+            && all_close(self.v.as_slice().unwrap(), other, |a, b| (a - b).norm_sqr())
+    }
+
+    /// Check if this quantum state is close to a slice of complex amplitudes.
+    pub fn isclose_complex(&self, other: &[Complex64]) -> bool {
+        self.v.len() == other.len()
+            && all_close(self.v.as_slice().unwrap(), other, |a, b| (a - b).norm_sqr())
     }
 
     // ---- Gate methods (consume self for chaining) ----
@@ -366,7 +1038,7 @@ impl QReg {
 
     /// Apply controlled-NOT gate.
     pub fn cnot(mut self, control: usize, target: usize) -> Self {
-        self.apply2q(&CNOT_GATE, control, target);
+        self.apply_cnot(control, target);
         self
     }
 
@@ -404,6 +1076,34 @@ impl QReg {
         }
         results
     }
+
+    /// Sample `nshots` measurements of every qubit from |amplitude|^2,
+    /// without collapsing the state. Each outcome is a basis-state index.
+    ///
+    /// Shots run in parallel in tasks of `SHOTS_PER_TASK`, each with its own
+    /// `StdRng` seeded from `rng`, so a seeded `rng` gives repeatable results.
+    pub fn sample(&self, nshots: usize, rng: &mut impl Rng) -> Vec<usize> {
+        let mut cdf: Vec<f64> = self.v.iter().map(|x| x.norm_sqr()).collect();
+        for i in 1..cdf.len() {
+            cdf[i] += cdf[i - 1];
+        }
+        let total = cdf[cdf.len() - 1];
+        let seeds: Vec<u64> = (0..nshots.div_ceil(SHOTS_PER_TASK))
+            .map(|_| rng.r#gen())
+            .collect();
+        let mut shots = vec![0; nshots];
+        shots
+            .par_chunks_mut(SHOTS_PER_TASK)
+            .zip(seeds)
+            .for_each(|(chunk, seed)| {
+                let mut rng = StdRng::seed_from_u64(seed);
+                for shot in chunk {
+                    let u = rng.r#gen::<f64>() * total;
+                    *shot = cdf.partition_point(|&c| c <= u).min(cdf.len() - 1);
+                }
+            });
+        shots
+    }
 }
 
 impl fmt::Display for QReg {
@@ -440,6 +1140,11 @@ impl Mul for QReg {
 
 // ---- Convenience Functions ----
 
+/// Most qubits a register can have: its 2^n 16-byte (2^(n+4)-byte) amplitudes
+/// must fit in `isize::MAX` = 2^(BITS-1) - 1 bytes, so n + 4 <= BITS - 2.
+/// This also keeps `1 << n` from overflowing.
+pub const MAX_QUBITS: usize = usize::BITS as usize - 6;
+
 /// Create a quantum ket state from a string specification.
 ///
 /// Characters: '0' = |0>, '1' = |1>, '+' = |+>, '-' = |->
@@ -455,6 +1160,17 @@ pub fn ket(vecstring: &str) -> QReg {
             "Invalid character '{ch}' in vecstring. Valid: 0, 1, +, -"
         );
     }
+    assert!(
+        vecstring.len() <= MAX_QUBITS,
+        "Register can have at most {MAX_QUBITS} qubits, got {}",
+        vecstring.len()
+    );
+
+    // Computational basis labels ("0101") are a single 1 in a zero vector
+    if vecstring.chars().all(|ch| ch == '0' || ch == '1') {
+        let index = vecstring.chars().fold(0, |i, ch| 2 * i + (ch == '1') as usize);
+        return basis(vecstring.len(), index);
+    }
 
     let qvec = |s: char| -> Array1<Complex64> {
         match s {
@@ -473,6 +1189,43 @@ pub fn ket(vecstring: &str) -> QReg {
     QReg::from_array(register)
 }
 
+/// Create the computational basis state |index> on `n` qubits.
+///
+/// Equivalent to `ket()` with the binary label of `index`, but allocates the
+/// state vector once instead of building it through repeated tensor products.
+pub fn basis(n: usize, index: usize) -> QReg {
+    assert!(n > 0, "Register needs at least one qubit");
+    assert!(n <= MAX_QUBITS, "Register can have at most {MAX_QUBITS} qubits, got {n}");
+    let len = 1 << n;
+    assert!(index < len, "Basis index {index} out of range for {n} qubits");
+    let mut v = zero_state(len);
+    v[index] = ONE;
+    QReg { v, n }
+}
+
+/// Create the n-qubit GHZ state (|0...0> + |1...1>) / sqrt(2) directly,
+/// without running the H + CNOT-chain circuit.
+pub fn ghz(n: usize) -> QReg {
+    assert!(n > 0, "Register needs at least one qubit");
+    assert!(n <= MAX_QUBITS, "Register can have at most {MAX_QUBITS} qubits, got {n}");
+    let len = 1 << n;
+    let mut v = zero_state(len);
+    v[0] = S2;
+    v[len - 1] = S2;
+    QReg { v, n }
+}
+
+/// A zeroed state vector, filled in parallel so large states don't pay a
+/// single-threaded zero-fill.
+fn zero_state(len: usize) -> Array1<Complex64> {
+    Array1::from_vec((0..len).into_par_iter().map(|_| ZERO).collect())
+}
+
+// ---- Single Precision ----
+
+mod qreg32;
+pub use qreg32::QReg32;
+
 // ---- Python Bindings ----
 
 #[cfg(feature = "pyo3")]
@@ -522,6 +1275,13 @@ mod tests {
         assert_eq!(ket("101").to_string(), "1.0|101>");
     }
 
+    #[test]
+    fn test_basis_matches_kron_construction() {
+        assert!(basis(3, 0b101).isclose(&(ket("1") * ket("0") * ket("1"))));
+        assert!(ket("0110").isclose(&(ket("01") * ket("10"))));
+        assert_eq!(basis(2, 2).to_string(), "1.0|10>");
+    }
+
     // -- Single-qubit gate tests --
 
     #[test]
@@ -553,6 +1313,38 @@ mod tests {
         assert!(ket("++").isclose_slice(&[0.5, 0.5, 0.5, 0.5]));
     }
 
+    #[test]
+    fn test_max_qubits_fits_in_isize() {
+        let bytes = (1u128 << MAX_QUBITS) * std::mem::size_of::<Complex64>() as u128;
+        assert!(bytes <= isize::MAX as u128);
+        let bytes = (1u128 << (MAX_QUBITS + 1)) * std::mem::size_of::<Complex64>() as u128;
+        assert!(bytes > isize::MAX as u128);
+    }
+
+    #[test]
+    fn test_isclose_large_register() {
+        // Above one tile, so the parallel early-exit scan is used
+        let n = 16;
+        let q = ghz(n);
+        assert!(q.isclose(&ghz(n)));
+        assert!(!q.isclose(&ket(&"0".repeat(n))));
+        let mut far_end = ghz(n);
+        far_end.v[(1 << n) - 2] = Complex64::new(1e-3, 0.0);
+        assert!(!q.isclose(&far_end));
+        let mut amps = vec![ZERO; 1 << n];
+        amps[0] = Complex64::new(std::f64::consts::FRAC_1_SQRT_2, 0.0);
+        amps[(1 << n) - 1] = amps[0];
+        assert!(q.isclose_complex(&amps));
+        assert!(!q.isclose_complex(&amps[1..]));
+        // complex64 registers compare without widening the whole state
+        let q32 = QReg32::ghz(n);
+        assert!(q32.isclose(&QReg32::ghz(n)));
+        assert!(q32.isclose_qreg(&q));
+        assert!(!q32.isclose_qreg(&far_end));
+        assert!(q32.isclose_complex(&amps));
+        assert!(!q32.isclose_slice(&[0.0; 4]));
+    }
+
     #[test]
     fn test_isclose_minus_minus() {
         assert!(ket("--").isclose_slice(&[0.5, -0.5, -0.5, 0.5]));
@@ -602,6 +1394,18 @@ mod tests {
         assert!(r2.iter().all(|&x| x == r1[0]));
     }
 
+    #[test]
+    fn test_sample_ghz_outcomes() {
+        let q = ghz(4);
+        let shots = q.sample(5000, &mut StdRng::seed_from_u64(7));
+        assert_eq!(shots.len(), 5000);
+        assert!(shots.iter().all(|&s| s == 0 || s == 15));
+        let ones = shots.iter().filter(|&&s| s == 15).count();
+        assert!((2000..3000).contains(&ones));
+        assert_eq!(q.sample(3, &mut StdRng::seed_from_u64(7)), shots[..3]);
+        assert_eq!(basis(3, 5).sample(10, &mut StdRng::seed_from_u64(1)), vec![5; 10]);
+    }
+
     // -- ket terms() direct call (Python: ket('10').terms() == '1.0|10>') --
 
     #[test]
@@ -761,4 +1565,256 @@ mod tests {
             std::f64::consts::FRAC_1_SQRT_2
         ]));
     }
+
+    // -- Large registers (SIMD kernels split across rayon tasks) --
+
+    #[test]
+    fn test_hadamard_all_qubits_large_register() {
+        let n = 14;
+        let mut q = ket(&"+".repeat(n));
+        for t in 0..n {
+            q.apply1q(&H_GATE, t);
+        }
+        assert!(q.isclose(&ket(&"0".repeat(n))));
+        let q = q.x(n - 1).x(0);
+        assert_eq!(q.to_string(), format!("1.0|1{}1>", "0".repeat(n - 2)));
+    }
+
+    #[test]
+    fn test_two_qubit_kernel_all_stride_regimes() {
+        // n = 15 reaches every branch of for_each_quad_run (TILE = 2^14)
+        let n = 15;
+        let v: Array1<Complex64> = (0..1 << n)
+            .map(|i| Complex64::new((i as f64).sin(), (0.5 * i as f64).cos()))
+            .collect();
+        let m: Vec<Complex64> = (0..16)
+            .map(|i| Complex64::new(0.1 * i as f64, 1.0 - 0.05 * i as f64))
+            .collect();
+        let m2 = Array2::from_shape_vec((4, 4), m.clone()).unwrap();
+        for (c, t) in [(0, 1), (1, 0), (3, 14), (14, 3), (13, 14), (14, 13)] {
+            let mut a = QReg::from_array(v.clone());
+            let mut b = QReg::from_array(v.clone());
+            a.apply2q(&m2, c, t);
+            b.applynq(&m, &[t, c]);
+            assert!(a.isclose(&b), "mismatch for control {c}, target {t}");
+        }
+    }
+
+    #[test]
+    fn test_cnot_permutation_matches_matrix() {
+        let n = 15;
+        let v: Array1<Complex64> = (0..1 << n)
+            .map(|i| Complex64::new((i as f64).cos(), (0.3 * i as f64).sin()))
+            .collect();
+        for (c, t) in [(0, 1), (1, 0), (2, 14), (14, 2), (13, 14), (14, 13)] {
+            let mut a = QReg::from_array(v.clone());
+            let mut b = QReg::from_array(v.clone());
+            a.apply_cnot(c, t);
+            b.apply2q(&CNOT_GATE, c, t);
+            assert!(a.isclose(&b), "mismatch for control {c}, target {t}");
+        }
+        assert!(Op::Cnot(3, 1).to_gate().is_cnot());
+        assert!(!Op::Cphase(3, 1).to_gate().is_cnot());
+    }
+
+    #[test]
+    fn test_ghz_constructor_matches_circuit() {
+        for n in [1, 2, 5] {
+            let mut q = ket(&"0".repeat(n));
+            q.apply1q(&H_GATE, 0);
+            for i in 0..n - 1 {
+                q.apply2q(&CNOT_GATE, i, i + 1);
+            }
+            assert!(ghz(n).isclose(&q));
+        }
+    }
+
+    #[test]
+    fn test_qreg32_matches_double_precision() {
+        let ops = [
+            Op::H(0),
+            Op::Cnot(0, 1),
+            Op::S(1),
+            Op::Y(2),
+            Op::Cphase(2, 0),
+            Op::X(0),
+            Op::X(2),
+            Op::Z(1),
+            Op::H(2),
+        ];
+        let mut q = ket("0+0");
+        q.apply_circuit(&ops);
+        let mut unfused = QReg32::ket("0+0");
+        unfused.apply_circuit(&ops);
+        assert!(unfused.to_qreg().isclose(&q));
+        for max in [1, 3] {
+            let mut fused = QReg32::ket("0+0");
+            fused.apply_fused_circuit(&fuse(&ops, max));
+            assert!(fused.to_qreg().isclose(&q));
+        }
+        assert!(QReg32::ghz(4).to_qreg().isclose(&ghz(4)));
+    }
+
+    #[test]
+    fn test_qreg32_native_ops_match_double_precision() {
+        let (a, b) = (ket("+-"), ket("01"));
+        let (a32, b32) = (QReg32::ket("+-"), QReg32::ket("01"));
+        assert_eq!(a32.to_string(), "0.5|00> -0.5|01> 0.5|10> -0.5|11>");
+        assert_eq!(QReg32::ghz(3).terms(), "0.7071068|000> 0.7071068|111>");
+        assert!((a32.clone() + b32.clone()).to_qreg().isclose(&(a.clone() + b.clone())));
+        assert!((a32.clone() - b32.clone()).to_qreg().isclose(&(a.clone() - b.clone())));
+        assert!((a32 * b32).to_qreg().isclose(&(a * b)));
+
+        let mut q = ket("++");
+        let mut q32 = QReg32::ket("++");
+        let m = q.measure(1, 3, &mut StdRng::seed_from_u64(7));
+        let m32 = q32.measure(1, 3, &mut StdRng::seed_from_u64(7));
+        assert_eq!(m32, m);
+        assert!(q32.to_qreg().isclose(&q));
+    }
+
+    // -- Batched circuit application --
+
+    #[test]
+    fn test_apply_circuit_matches_chained_gates() {
+        let mut q = ket("000");
+        q.apply_circuit(&[Op::H(0), Op::Cnot(0, 1), Op::Cnot(1, 2)]);
+        assert!(q.isclose(&ket("000").h(0).cnot(0, 1).cnot(1, 2)));
+
+        let mut q = ket("01");
+        q.apply_circuit(&[Op::X(1), Op::Y(0), Op::S(1), Op::Cphase(0, 1), Op::Z(0)]);
+        assert!(q.isclose(&ket("01").x(1).y(0).s(1).cphase(0, 1).z(0)));
+    }
+
+    // -- Gate fusion --
+
+    #[test]
+    fn test_fused_circuit_matches_unfused() {
+        let ops = [
+            Op::H(0),
+            Op::S(0),
+            Op::Cnot(0, 1),
+            Op::Y(2),
+            Op::H(3),
+            Op::Cnot(1, 2),
+            Op::Cphase(3, 0),
+            Op::X(1),
+            Op::Cnot(2, 4),
+            Op::S(4),
+            Op::H(4),
+        ];
+        let mut expected = ket("01001");
+        expected.apply_circuit(&ops);
+        for max_fused_qubits in 1..=MAX_FUSED_QUBITS {
+            let mut q = ket("01001");
+            q.apply_fused_circuit(&fuse(&ops, max_fused_qubits));
+            assert!(q.isclose(&expected), "max_fused_qubits = {max_fused_qubits}");
+        }
+    }
+
+    #[test]
+    fn test_fuse_coalesces_single_qubit_runs() {
+        // H and S on each of two qubits collapse to one 2x2 gate per qubit
+        let ops = [Op::H(0), Op::H(1), Op::S(0), Op::S(1)];
+        let fused = fuse(&ops, 1);
+        assert_eq!(fused.len(), 2);
+        assert!(fused.iter().all(|op| matches!(op, FusedOp::Gate(g) if g.qubits.len() == 1)));
+    }
+
+    #[test]
+    fn test_fuse_drops_identities() {
+        use Op::*;
+        assert!(fuse(&[H(0), H(0)], 4).is_empty());
+        assert!(fuse(&[H(0), X(0), X(0), H(0)], 4).is_empty());
+        assert!(fuse(&[Cnot(0, 1), Cnot(0, 1)], 1).is_empty());
+        assert!(fuse(&[S(1), S(1), S(1), S(1)], 4).is_empty());
+        // Not adjacent, but pass 2 multiplies the two CNOTs to the identity
+        let ops = [Cnot(0, 1), H(2), Cnot(0, 1)];
+        assert_eq!(fuse(&ops, 4).len(), 1);
+        assert_eq!(fuse(&ops, 1).len(), 3);
+        let mut fused = ket("+0+");
+        fused.apply_fused_circuit(&fuse(&ops, 4));
+        assert!(fused.isclose(&ket("+0+").h(2)));
+    }
+
+    #[test]
+    fn test_fuse_pauli_masks() {
+        let ops = [Op::H(0), Op::H(1), Op::X(0), Op::X(2), Op::Z(1), Op::Z(0), Op::Z(1), Op::H(2)];
+        let fused = fuse(&ops, 2);
+        assert!(fused.iter().any(|op| matches!(op, FusedOp::XMask(0b101))));
+        assert!(fused.iter().any(|op| matches!(op, FusedOp::ZMask(0b001))));
+
+        let mut expected = ket("011");
+        expected.apply_circuit(&ops);
+        let mut q = ket("011");
+        q.apply_fused_circuit(&fused);
+        assert!(q.isclose(&expected));
+
+        // X on the same qubit twice cancels
+        assert!(fuse(&[Op::X(1), Op::X(1)], 4).is_empty());
+
+        // A qubit past the word size must not wrap into a mask on qubit 0
+        let fused = fuse(&[Op::X(64), Op::X(1)], 4);
+        assert!(fused.iter().all(|op| !matches!(op, FusedOp::XMask(_))));
+        assert!(
+            fused
+                .iter()
+                .any(|op| matches!(op, FusedOp::Gate(g) if g.qubits.contains(&64)))
+        );
+    }
+
+    #[test]
+    fn test_fuse_keeps_cnot_chain_bare() {
+        // Fusing the GHZ chain into wider gates would trade swaps for gathers
+        let ops: Vec<Op> = std::iter::once(Op::H(0))
+            .chain((0..5).map(|i| Op::Cnot(i, i + 1)))
+            .collect();
+        let fused = fuse(&ops, 4);
+        assert_eq!(fused.len(), 6);
+        assert!(matches!(&fused[0], FusedOp::Gate(g) if g.qubits == [0]));
+        assert!(
+            fused[1..]
+                .iter()
+                .all(|op| matches!(op, FusedOp::Gate(g) if g.is_cnot()))
+        );
+        // ...but a CNOT on qubits the gate already covers is still absorbed
+        let ops = [Op::Cphase(0, 1), Op::H(2), Op::Cnot(2, 0), Op::Cnot(0, 1)];
+        assert_eq!(fuse(&ops, 3).len(), 1);
+    }
+
+    #[test]
+    fn test_fused_permutation_matches_unfused() {
+        // S, Cphase, X and a covered CNOT on three qubits multiply out to a
+        // permutation with phases, which runs through `perm_kernel`
+        let ops = [
+            Op::S(2),
+            Op::Cphase(1, 2),
+            Op::X(0),
+            Op::Cphase(0, 1),
+            Op::X(2),
+            Op::Cnot(2, 0),
+        ];
+        let fused = fuse(&ops, 3);
+        let [FusedOp::Gate(gate)] = &fused[..] else { panic!("expected one gate") };
+        assert_eq!(gate.qubits.len(), 3);
+        assert!(gate.permutation().is_some());
+        assert!(fuse(&[Op::Cphase(0, 1), Op::H(2), Op::Cnot(2, 0)], 3)
+            .iter()
+            .all(|op| !matches!(op, FusedOp::Gate(g) if g.permutation().is_some())));
+
+        for ops in [
+            ops.to_vec(),
+            vec![Op::Cnot(4, 0), Op::Cphase(0, 3), Op::Cnot(3, 4), Op::X(0), Op::Cnot(0, 3)],
+        ] {
+            let ops = [&[Op::H(3)], &ops[..]].concat();
+            let mut expected = ket("10110");
+            expected.apply_circuit(&ops);
+            let mut q = ket("10110");
+            q.apply_fused_circuit(&fuse(&ops, 4));
+            assert!(q.isclose(&expected));
+            let mut q32 = QReg32::ket("10110");
+            q32.apply_fused_circuit(&fuse(&ops, 4));
+            assert!(q32.to_qreg().isclose(&expected));
+        }
+    }
 }
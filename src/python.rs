@@ -1,263 +1,326 @@
 // PyO3 Python bindings for rvecsim
 //
 // Provides a Python API matching the original vecsim.py:
-// - ket('0') constructor
+// - ket('0') constructor (plus ghz(n) for GHZ states), with dtype='complex64'
+//   for single-precision registers
 // - Gate methods: X, Y, Z, H, S, CNOT, CPHASE (uppercase, method chaining)
+// - apply_circuit() for running a list of gates in one call
+// - Circuit for building a gate list once and running it many times
+// - run_batch() for sampling many measurement shots in one call
 // - M for measurement
 // - Operators: +, -, *
 // - isclose() accepting QReg or list
 
 #![allow(non_snake_case)]
 
-use crate::{ket as rust_ket, QReg as RustQReg};
+use crate::{
+    basis, fuse, ghz as rust_ghz, ket as rust_ket, FusedOp, Op, QReg as RustQReg, QReg32,
+    MAX_FUSED_QUBITS, MAX_QUBITS,
+};
 use num_complex::Complex64;
+use numpy::{IntoPyArray, PyArray1, ToPyArray};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::{PyList, PyTuple};
 use rand::thread_rng;
+use std::borrow::Cow;
+use std::sync::{Arc, OnceLock};
 
 /// Python wrapper for QReg
 #[pyclass(name = "QReg")]
 pub struct PyQReg {
-    inner: RustQReg,
+    inner: State,
 }
 
-#[pymethods]
-impl PyQReg {
-    // ---- Properties ----
+/// Amplitude precision of a Python QReg, from the `dtype` argument
+#[derive(Copy, Clone, PartialEq)]
+enum Dtype {
+    Complex128,
+    Complex64,
+}
 
-    /// Number of qubits
-    #[getter]
-    fn n(&self) -> usize {
-        self.inner.n
+impl Dtype {
+    fn parse(dtype: &str) -> PyResult<Self> {
+        match dtype {
+            "complex128" => Ok(Dtype::Complex128),
+            "complex64" => Ok(Dtype::Complex64),
+            _ => Err(PyValueError::new_err(format!(
+                "Invalid dtype '{}'. Valid: complex128, complex64",
+                dtype
+            ))),
+        }
     }
+}
 
-    /// State vector amplitudes as list of complex numbers
-    #[getter]
-    fn amplitudes(&self) -> Vec<Complex64> {
-        self.inner.v.to_vec()
-    }
+/// State vector behind a Python QReg. Everything runs in the register's own
+/// precision; `double()`/`single()` convert only when two registers of
+/// different dtypes meet.
+#[derive(Clone)]
+enum State {
+    Double(RustQReg),
+    Single(QReg32),
+}
 
-    /// L2 norm of the state vector
-    #[getter]
-    fn norm(&self) -> f64 {
-        self.inner.norm()
+impl State {
+    fn n(&self) -> usize {
+        match self {
+            State::Double(q) => q.n,
+            State::Single(q) => q.n,
+        }
     }
 
-    // ---- String representations ----
+    fn dtype(&self) -> Dtype {
+        match self {
+            State::Double(_) => Dtype::Complex128,
+            State::Single(_) => Dtype::Complex64,
+        }
+    }
 
-    fn __str__(&self) -> String {
-        self.inner.to_string()
+    fn double(&self) -> Cow<'_, RustQReg> {
+        match self {
+            State::Double(q) => Cow::Borrowed(q),
+            State::Single(q) => Cow::Owned(q.to_qreg()),
+        }
     }
 
-    fn __repr__(&self) -> String {
-        format!("QReg({})", self.inner.terms())
+    fn single(&self) -> Cow<'_, QReg32> {
+        match self {
+            State::Double(q) => Cow::Owned(QReg32::from(q)),
+            State::Single(q) => Cow::Borrowed(q),
+        }
     }
 
     fn terms(&self) -> String {
-        self.inner.terms()
+        match self {
+            State::Double(q) => q.terms(),
+            State::Single(q) => q.terms(),
+        }
     }
 
-    // ---- Single-qubit gates ----
-
-    /// Apply Pauli-X (NOT) gate to target qubit
-    fn X(slf: Py<Self>, target: usize, py: Python<'_>) -> PyResult<Py<Self>> {
-        // Validate and clone data while holding GIL
-        let mut inner = {
-            let this = slf.borrow(py);
-            if target >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid target qubit {}. Must be in [0, {})",
-                    target, this.inner.n
-                )));
+    fn isclose(&self, other: &State) -> bool {
+        match (self, other) {
+            (State::Double(a), State::Double(b)) => a.isclose(b),
+            (State::Single(a), State::Single(b)) => a.isclose(b),
+            (State::Single(a), State::Double(b)) | (State::Double(b), State::Single(a)) => {
+                a.isclose_qreg(b)
             }
-            this.inner.clone()
-        };
+        }
+    }
 
-        // Release GIL during computation
-        py.allow_threads(|| {
-            inner.apply1q(&crate::X_GATE, target);
-        });
+    fn isclose_complex(&self, other: &[Complex64]) -> bool {
+        match self {
+            State::Double(q) => q.isclose_complex(other),
+            State::Single(q) => q.isclose_complex(other),
+        }
+    }
 
-        // Update the Python object
-        {
-            let mut this = slf.borrow_mut(py);
-            this.inner = inner;
+    fn isclose_slice(&self, other: &[f64]) -> bool {
+        match self {
+            State::Double(q) => q.isclose_slice(other),
+            State::Single(q) => q.isclose_slice(other),
         }
+    }
 
-        Ok(slf)
+    /// Apply a binary register operator in the precision of `self`.
+    fn combine(
+        &self,
+        other: &State,
+        double: fn(RustQReg, RustQReg) -> RustQReg,
+        single: fn(QReg32, QReg32) -> QReg32,
+    ) -> State {
+        match self {
+            State::Double(q) => State::Double(double(q.clone(), other.double().into_owned())),
+            State::Single(q) => State::Single(single(q.clone(), other.single().into_owned())),
+        }
     }
 
-    /// Apply Pauli-Y gate to target qubit
-    fn Y(slf: Py<Self>, target: usize, py: Python<'_>) -> PyResult<Py<Self>> {
-        let mut inner = {
-            let this = slf.borrow(py);
-            if target >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid target qubit {}. Must be in [0, {})",
-                    target, this.inner.n
-                )));
+    fn apply_op(&mut self, op: Op) {
+        match self {
+            State::Double(q) => {
+                q.apply_op(op);
             }
-            this.inner.clone()
-        };
+            State::Single(q) => {
+                q.apply_op(op);
+            }
+        }
+    }
 
-        py.allow_threads(|| {
-            inner.apply1q(&crate::Y_GATE, target);
-        });
+    fn apply_circuit(&mut self, ops: &[Op]) {
+        match self {
+            State::Double(q) => {
+                q.apply_circuit(ops);
+            }
+            State::Single(q) => {
+                q.apply_circuit(ops);
+            }
+        }
+    }
 
-        {
-            let mut this = slf.borrow_mut(py);
-            this.inner = inner;
+    fn apply_fused_circuit(&mut self, ops: &[FusedOp]) {
+        match self {
+            State::Double(q) => {
+                q.apply_fused_circuit(ops);
+            }
+            State::Single(q) => {
+                q.apply_fused_circuit(ops);
+            }
         }
+    }
 
-        Ok(slf)
+    fn measure(&mut self, i: usize, ntimes: usize) -> Vec<usize> {
+        let mut rng = thread_rng();
+        match self {
+            State::Double(q) => q.measure(i, ntimes, &mut rng),
+            State::Single(q) => q.measure(i, ntimes, &mut rng),
+        }
     }
+}
 
-    /// Apply Pauli-Z gate to target qubit
-    fn Z(slf: Py<Self>, target: usize, py: Python<'_>) -> PyResult<Py<Self>> {
-        let mut inner = {
-            let this = slf.borrow(py);
-            if target >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid target qubit {}. Must be in [0, {})",
-                    target, this.inner.n
-                )));
-            }
-            this.inner.clone()
-        };
+#[pymethods]
+impl PyQReg {
+    // ---- Properties ----
 
-        py.allow_threads(|| {
-            inner.apply1q(&crate::Z_GATE, target);
-        });
+    /// Number of qubits
+    #[getter]
+    fn n(&self) -> usize {
+        self.inner.n()
+    }
 
-        {
-            let mut this = slf.borrow_mut(py);
-            this.inner = inner;
+    /// Amplitude dtype: 'complex128' (default) or 'complex64'
+    #[getter]
+    fn dtype(&self) -> &'static str {
+        match self.inner.dtype() {
+            Dtype::Complex128 => "complex128",
+            Dtype::Complex64 => "complex64",
         }
+    }
 
-        Ok(slf)
+    /// State vector amplitudes as a NumPy array of the register's dtype
+    ///
+    /// The array is a copy: later gates on this QReg do not change it.
+    #[getter]
+    fn amplitudes<'py>(&self, py: Python<'py>) -> Bound<'py, PyAny> {
+        match &self.inner {
+            State::Double(q) => q.v.to_pyarray(py).into_any(),
+            State::Single(q) => q.v.to_pyarray(py).into_any(),
+        }
     }
 
-    /// Apply Hadamard gate to target qubit
-    fn H(slf: Py<Self>, target: usize, py: Python<'_>) -> PyResult<Py<Self>> {
-        let mut inner = {
-            let this = slf.borrow(py);
-            if target >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid target qubit {}. Must be in [0, {})",
-                    target, this.inner.n
-                )));
-            }
-            this.inner.clone()
-        };
+    /// L2 norm of the state vector
+    #[getter]
+    fn norm(&self) -> f64 {
+        match &self.inner {
+            State::Double(q) => q.norm(),
+            State::Single(q) => q.norm(),
+        }
+    }
 
-        py.allow_threads(|| {
-            inner.apply1q(&crate::H_GATE, target);
-        });
+    // ---- String representations ----
 
-        {
-            let mut this = slf.borrow_mut(py);
-            this.inner = inner;
+    fn __str__(&self) -> String {
+        self.inner.terms()
+    }
+
+    fn __repr__(&self) -> String {
+        match self.inner.dtype() {
+            Dtype::Complex128 => format!("QReg({})", self.terms()),
+            Dtype::Complex64 => format!("QReg({}, dtype='complex64')", self.terms()),
         }
+    }
 
-        Ok(slf)
+    fn terms(&self) -> String {
+        self.inner.terms()
     }
 
-    /// Apply S (phase) gate to target qubit
-    fn S(slf: Py<Self>, target: usize, py: Python<'_>) -> PyResult<Py<Self>> {
-        let mut inner = {
-            let this = slf.borrow(py);
-            if target >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid target qubit {}. Must be in [0, {})",
-                    target, this.inner.n
-                )));
-            }
-            this.inner.clone()
-        };
+    /// Independent copy of this register (same dtype)
+    fn copy(&self) -> PyQReg {
+        PyQReg {
+            inner: self.inner.clone(),
+        }
+    }
 
-        py.allow_threads(|| {
-            inner.apply1q(&crate::S_GATE, target);
-        });
+    // ---- Single-qubit gates ----
 
-        {
-            let mut this = slf.borrow_mut(py);
-            this.inner = inner;
-        }
+    /// Apply Pauli-X (NOT) gate to target qubit
+    fn X(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        apply_op(slf, Op::X(target))
+    }
 
-        Ok(slf)
+    /// Apply Pauli-Y gate to target qubit
+    fn Y(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        apply_op(slf, Op::Y(target))
     }
 
-    // ---- Two-qubit gates ----
+    /// Apply Pauli-Z gate to target qubit
+    fn Z(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        apply_op(slf, Op::Z(target))
+    }
 
-    /// Apply controlled-NOT gate
-    fn CNOT(slf: Py<Self>, control: usize, target: usize, py: Python<'_>) -> PyResult<Py<Self>> {
-        let mut inner = {
-            let this = slf.borrow(py);
-            if control >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid control qubit {}. Must be in [0, {})",
-                    control, this.inner.n
-                )));
-            }
-            if target >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid target qubit {}. Must be in [0, {})",
-                    target, this.inner.n
-                )));
-            }
-            if control == target {
-                return Err(PyValueError::new_err(
-                    "Control and target must be different qubits",
-                ));
-            }
-            this.inner.clone()
-        };
+    /// Apply Hadamard gate to target qubit
+    fn H(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        apply_op(slf, Op::H(target))
+    }
 
-        py.allow_threads(|| {
-            inner.apply2q(&crate::CNOT_GATE, control, target);
-        });
+    /// Apply S (phase) gate to target qubit
+    fn S(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        apply_op(slf, Op::S(target))
+    }
 
-        {
-            let mut this = slf.borrow_mut(py);
-            this.inner = inner;
-        }
+    // ---- Two-qubit gates ----
 
-        Ok(slf)
+    /// Apply controlled-NOT gate
+    fn CNOT(
+        slf: PyRefMut<'_, Self>,
+        control: usize,
+        target: usize,
+    ) -> PyResult<PyRefMut<'_, Self>> {
+        apply_op(slf, Op::Cnot(control, target))
     }
 
     /// Apply controlled-phase gate
-    fn CPHASE(slf: Py<Self>, control: usize, target: usize, py: Python<'_>) -> PyResult<Py<Self>> {
-        let mut inner = {
-            let this = slf.borrow(py);
-            if control >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid control qubit {}. Must be in [0, {})",
-                    control, this.inner.n
-                )));
-            }
-            if target >= this.inner.n {
-                return Err(PyValueError::new_err(format!(
-                    "Invalid target qubit {}. Must be in [0, {})",
-                    target, this.inner.n
-                )));
-            }
-            if control == target {
-                return Err(PyValueError::new_err(
-                    "Control and target must be different qubits",
-                ));
-            }
-            this.inner.clone()
-        };
-
-        py.allow_threads(|| {
-            inner.apply2q(&crate::CPHASE_GATE, control, target);
-        });
+    fn CPHASE(
+        slf: PyRefMut<'_, Self>,
+        control: usize,
+        target: usize,
+    ) -> PyResult<PyRefMut<'_, Self>> {
+        apply_op(slf, Op::Cphase(control, target))
+    }
 
-        {
-            let mut this = slf.borrow_mut(py);
-            this.inner = inner;
+    // ---- Circuits ----
+
+    /// Apply a list of gates in a single call
+    ///
+    /// Each op is a tuple of gate name and qubit indices, e.g.
+    /// [('H', 0), ('CNOT', 0, 1), ('CNOT', 1, 2)]. All ops are validated
+    /// before any is applied, then the whole circuit runs in Rust.
+    ///
+    /// Gates are fused into dense gates on up to max_fuse_size qubits
+    /// (default 4) before being applied; max_fuse_size=0 disables fusion.
+    #[pyo3(signature = (ops, max_fuse_size=4))]
+    fn apply_circuit<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        ops: &Bound<'py, PyList>,
+        max_fuse_size: usize,
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        if max_fuse_size > MAX_FUSED_QUBITS {
+            return Err(PyValueError::new_err(format!(
+                "Invalid max_fuse_size {}. Must be in [0, {}]",
+                max_fuse_size, MAX_FUSED_QUBITS
+            )));
         }
-
+        let n = slf.inner.n();
+        let circuit = ops
+            .iter()
+            .map(|item| parse_op(&item, n))
+            .collect::<PyResult<Vec<Op>>>()?;
+        let py = slf.py();
+        compute(py, &mut slf.inner, move |inner| {
+            if max_fuse_size == 0 {
+                inner.apply_circuit(&circuit);
+            } else {
+                inner.apply_fused_circuit(&fuse(&circuit, max_fuse_size));
+            }
+        });
         Ok(slf)
     }
 
@@ -266,15 +329,19 @@ impl PyQReg {
     /// Measure qubit i, ntimes times (default 1)
     /// Returns list of measurement outcomes (0 or 1)
     #[pyo3(signature = (i, ntimes=1))]
-    fn M(&mut self, i: usize, ntimes: usize) -> PyResult<Vec<usize>> {
-        if i >= self.inner.n {
+    fn M(&mut self, i: usize, ntimes: usize, py: Python<'_>) -> PyResult<Vec<usize>> {
+        if i >= self.inner.n() {
             return Err(PyValueError::new_err(format!(
                 "Invalid qubit {}. Must be in [0, {})",
-                i, self.inner.n
+                i,
+                self.inner.n()
             )));
         }
-        let mut rng = thread_rng();
-        Ok(self.inner.measure(i, ntimes, &mut rng))
+        let mut results = Vec::new();
+        compute(py, &mut self.inner, |inner| {
+            results = inner.measure(i, ntimes);
+        });
+        Ok(results)
     }
 
     // ---- Comparison ----
@@ -288,15 +355,7 @@ impl PyQReg {
 
         // Try to extract as list of complex numbers
         if let Ok(complex_list) = other.extract::<Vec<Complex64>>() {
-            if self.inner.v.len() != complex_list.len() {
-                return Ok(false);
-            }
-            return Ok(self
-                .inner
-                .v
-                .iter()
-                .zip(complex_list.iter())
-                .all(|(a, b)| (a - b).norm() < 1e-5));
+            return Ok(self.inner.isclose_complex(&complex_list));
         }
 
         // Try to extract as list of floats (real numbers)
@@ -314,22 +373,281 @@ impl PyQReg {
     /// Superposition: (|a> + |b>) / sqrt(2)
     fn __add__(&self, other: &PyQReg) -> PyQReg {
         PyQReg {
-            inner: self.inner.clone() + other.inner.clone(),
+            inner: self.inner.combine(&other.inner, |a, b| a + b, |a, b| a + b),
         }
     }
 
     /// Subtraction: (|a> - |b>) / sqrt(2)
     fn __sub__(&self, other: &PyQReg) -> PyQReg {
         PyQReg {
-            inner: self.inner.clone() - other.inner.clone(),
+            inner: self.inner.combine(&other.inner, |a, b| a - b, |a, b| a - b),
         }
     }
 
     /// Tensor product: |a> ⊗ |b>
     fn __mul__(&self, other: &PyQReg) -> PyQReg {
         PyQReg {
-            inner: self.inner.clone() * other.inner.clone(),
+            inner: self.inner.combine(&other.inner, |a, b| a * b, |a, b| a * b),
+        }
+    }
+}
+
+/// A gate list on a fixed number of qubits, built once and run many times
+///
+/// Gates are validated as they are appended. The fusion plan is computed on
+/// the first run() and reused until another gate is appended. run() holds no
+/// borrow of the circuit while it computes, so several threads can run the
+/// same circuit at once.
+///
+/// Example:
+///     circ = Circuit(3).H(0).CNOT(0, 1).CNOT(1, 2)
+///     ghz_state = circ.run()
+#[pyclass(name = "Circuit")]
+pub struct PyCircuit {
+    n: usize,
+    max_fuse_size: usize,
+    ops: Vec<Op>,
+    plan: OnceLock<Arc<Vec<FusedOp>>>,
+}
+
+impl PyCircuit {
+    fn push(mut slf: PyRefMut<'_, Self>, op: Op) -> PyResult<PyRefMut<'_, Self>> {
+        check_op(op, slf.n)?;
+        slf.ops.push(op);
+        slf.plan = OnceLock::new();
+        Ok(slf)
+    }
+
+    /// The fused circuit, computed on first use after the last append.
+    fn plan(&self) -> Arc<Vec<FusedOp>> {
+        let plan = self.plan.get_or_init(|| {
+            Arc::new(if self.max_fuse_size == 0 {
+                self.ops.iter().map(|op| FusedOp::Gate(op.to_gate())).collect()
+            } else {
+                fuse(&self.ops, self.max_fuse_size)
+            })
+        });
+        Arc::clone(plan)
+    }
+}
+
+#[pymethods]
+impl PyCircuit {
+    /// Create an empty circuit on n qubits
+    ///
+    /// Gates are fused into dense gates on up to max_fuse_size qubits
+    /// (default 4) when the circuit runs; max_fuse_size=0 disables fusion.
+    #[new]
+    #[pyo3(signature = (n, max_fuse_size=4))]
+    fn new(n: usize, max_fuse_size: usize) -> PyResult<Self> {
+        check_qubits(n)?;
+        if max_fuse_size > MAX_FUSED_QUBITS {
+            return Err(PyValueError::new_err(format!(
+                "Invalid max_fuse_size {}. Must be in [0, {}]",
+                max_fuse_size, MAX_FUSED_QUBITS
+            )));
+        }
+        Ok(PyCircuit {
+            n,
+            max_fuse_size,
+            ops: Vec::new(),
+            plan: OnceLock::new(),
+        })
+    }
+
+    /// Number of qubits
+    #[getter]
+    fn n(&self) -> usize {
+        self.n
+    }
+
+    fn __len__(&self) -> usize {
+        self.ops.len()
+    }
+
+    /// Append Pauli-X (NOT) gate on target qubit
+    fn X(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        Self::push(slf, Op::X(target))
+    }
+
+    /// Append Pauli-Y gate on target qubit
+    fn Y(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        Self::push(slf, Op::Y(target))
+    }
+
+    /// Append Pauli-Z gate on target qubit
+    fn Z(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        Self::push(slf, Op::Z(target))
+    }
+
+    /// Append Hadamard gate on target qubit
+    fn H(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        Self::push(slf, Op::H(target))
+    }
+
+    /// Append S (phase) gate on target qubit
+    fn S(slf: PyRefMut<'_, Self>, target: usize) -> PyResult<PyRefMut<'_, Self>> {
+        Self::push(slf, Op::S(target))
+    }
+
+    /// Append controlled-NOT gate
+    fn CNOT(
+        slf: PyRefMut<'_, Self>,
+        control: usize,
+        target: usize,
+    ) -> PyResult<PyRefMut<'_, Self>> {
+        Self::push(slf, Op::Cnot(control, target))
+    }
+
+    /// Append controlled-phase gate
+    fn CPHASE(
+        slf: PyRefMut<'_, Self>,
+        control: usize,
+        target: usize,
+    ) -> PyResult<PyRefMut<'_, Self>> {
+        Self::push(slf, Op::Cphase(control, target))
+    }
+
+    /// Run the circuit and return the resulting QReg
+    ///
+    /// Starts from |0...0> unless a QReg on the same number of qubits is
+    /// given, in which case that register is updated in place and returned.
+    #[pyo3(signature = (state=None))]
+    fn run(slf: &Bound<'_, Self>, state: Option<Py<PyQReg>>) -> PyResult<Py<PyQReg>> {
+        let py = slf.py();
+        // Borrow the circuit only long enough to take a handle on the plan
+        let (n, plan) = {
+            let circuit = slf.try_borrow()?;
+            (circuit.n, circuit.plan())
+        };
+        let state = match state {
+            Some(state) => state,
+            None => Py::new(
+                py,
+                PyQReg {
+                    inner: State::Double(basis(n, 0)),
+                },
+            )?,
+        };
+        {
+            let mut q = state.try_borrow_mut(py)?;
+            if q.inner.n() != n {
+                return Err(PyValueError::new_err(format!(
+                    "Circuit is on {} qubits but the QReg has {}",
+                    n,
+                    q.inner.n()
+                )));
+            }
+            compute(py, &mut q.inner, |inner| inner.apply_fused_circuit(&plan));
+        }
+        Ok(state)
+    }
+}
+
+/// Registers with fewer qubits than this are computed with the GIL held:
+/// releasing and reacquiring it costs more than the gate itself.
+const GIL_RELEASE_MIN_QUBITS: usize = 10;
+
+/// Run `f` on the register, releasing the GIL for large states so rayon's
+/// worker threads are not starved. The closure must not touch Python objects.
+fn compute<F>(py: Python<'_>, inner: &mut State, f: F)
+where
+    F: FnOnce(&mut State) + Send,
+{
+    if inner.n() < GIL_RELEASE_MIN_QUBITS {
+        f(inner);
+    } else {
+        py.allow_threads(move || f(inner));
+    }
+}
+
+/// Validate a single gate against the register and apply it in place.
+///
+/// Takes and returns the borrowed register itself, so chained calls hand
+/// the same Python object back without any new wrapper.
+fn apply_op(mut slf: PyRefMut<'_, PyQReg>, op: Op) -> PyResult<PyRefMut<'_, PyQReg>> {
+    check_op(op, slf.inner.n())?;
+    let py = slf.py();
+    compute(py, &mut slf.inner, |inner| inner.apply_op(op));
+    Ok(slf)
+}
+
+/// Validate the qubit count of a new register (or circuit).
+fn check_qubits(n: usize) -> PyResult<()> {
+    if n == 0 {
+        return Err(PyValueError::new_err("Register needs at least one qubit"));
+    }
+    if n > MAX_QUBITS {
+        return Err(PyValueError::new_err(format!(
+            "Register can have at most {} qubits, got {}",
+            MAX_QUBITS, n
+        )));
+    }
+    Ok(())
+}
+
+fn check_target(target: usize, n: usize) -> PyResult<()> {
+    if target >= n {
+        return Err(PyValueError::new_err(format!(
+            "Invalid target qubit {}. Must be in [0, {})",
+            target, n
+        )));
+    }
+    Ok(())
+}
+
+fn check_pair(control: usize, target: usize, n: usize) -> PyResult<()> {
+    if control >= n {
+        return Err(PyValueError::new_err(format!(
+            "Invalid control qubit {}. Must be in [0, {})",
+            control, n
+        )));
+    }
+    check_target(target, n)?;
+    if control == target {
+        return Err(PyValueError::new_err(
+            "Control and target must be different qubits",
+        ));
+    }
+    Ok(())
+}
+
+/// Convert a Python gate tuple such as ('H', 0) or ('CNOT', 0, 1) into an Op,
+/// validating qubit indices against a register of `n` qubits.
+fn parse_op(item: &Bound<'_, PyAny>, n: usize) -> PyResult<Op> {
+    let tuple = item.downcast::<PyTuple>().map_err(|_| {
+        PyValueError::new_err("Circuit ops must be tuples like ('H', 0) or ('CNOT', 0, 1)")
+    })?;
+    if tuple.is_empty() {
+        return Err(PyValueError::new_err("Circuit op cannot be empty"));
+    }
+    let name: String = tuple.get_item(0)?.extract()?;
+    let qubit = |k: usize| -> PyResult<usize> { tuple.get_item(k)?.extract() };
+
+    let op = match (name.as_str(), tuple.len()) {
+        ("X", 2) => Op::X(qubit(1)?),
+        ("Y", 2) => Op::Y(qubit(1)?),
+        ("Z", 2) => Op::Z(qubit(1)?),
+        ("H", 2) => Op::H(qubit(1)?),
+        ("S", 2) => Op::S(qubit(1)?),
+        ("CNOT", 3) => Op::Cnot(qubit(1)?, qubit(2)?),
+        ("CPHASE", 3) => Op::Cphase(qubit(1)?, qubit(2)?),
+        _ => {
+            return Err(PyValueError::new_err(format!(
+                "Invalid circuit op {}. Valid: X, Y, Z, H, S (1 qubit), CNOT, CPHASE (2 qubits)",
+                tuple.repr()?
+            )));
         }
+    };
+
+    check_op(op, n)?;
+    Ok(op)
+}
+
+fn check_op(op: Op, n: usize) -> PyResult<()> {
+    match op {
+        Op::X(t) | Op::Y(t) | Op::Z(t) | Op::H(t) | Op::S(t) => check_target(t, n),
+        Op::Cnot(c, t) | Op::Cphase(c, t) => check_pair(c, t, n),
     }
 }
 
@@ -341,12 +659,15 @@ impl PyQReg {
 ///
 /// Args:
 ///     vecstring: String specifying the quantum state (default: '0')
+///     dtype: Amplitude precision, 'complex128' (default) or 'complex64'.
+///         complex64 halves memory and gate bandwidth for large registers.
 ///
 /// Returns:
 ///     QReg: The quantum register in the specified state
 #[pyfunction]
-#[pyo3(signature = (vecstring="0"))]
-fn ket(vecstring: &str) -> PyResult<PyQReg> {
+#[pyo3(signature = (vecstring="0", dtype="complex128"))]
+fn ket(vecstring: &str, dtype: &str) -> PyResult<PyQReg> {
+    let dtype = Dtype::parse(dtype)?;
     if vecstring.is_empty() {
         return Err(PyValueError::new_err("vecstring cannot be empty"));
     }
@@ -360,16 +681,67 @@ fn ket(vecstring: &str) -> PyResult<PyQReg> {
             )));
         }
     }
+    check_qubits(vecstring.len())?;
+
+    let inner = match dtype {
+        Dtype::Complex128 => State::Double(rust_ket(vecstring)),
+        Dtype::Complex64 => State::Single(QReg32::ket(vecstring)),
+    };
+    Ok(PyQReg { inner })
+}
 
-    Ok(PyQReg {
-        inner: rust_ket(vecstring),
-    })
+/// Create the n-qubit GHZ state (|0...0> + |1...1>)/√2 directly
+///
+/// Same state as ket('0'*n).H(0).CNOT(0, 1)...CNOT(n-2, n-1), built by
+/// writing the two nonzero amplitudes instead of running any gates.
+#[pyfunction]
+#[pyo3(signature = (n, dtype="complex128"))]
+fn ghz(n: usize, dtype: &str) -> PyResult<PyQReg> {
+    let dtype = Dtype::parse(dtype)?;
+    check_qubits(n)?;
+    let inner = match dtype {
+        Dtype::Complex128 => State::Double(rust_ghz(n)),
+        Dtype::Complex64 => State::Single(QReg32::ghz(n)),
+    };
+    Ok(PyQReg { inner })
+}
+
+/// Run a circuit from |0...0> and sample n_shots measurements of all qubits
+///
+/// The circuit runs once (it has no mid-circuit measurements), then shots
+/// are drawn in parallel from the final state with the GIL released.
+///
+/// Returns:
+///     numpy.ndarray: uint64 basis-state index of each shot (qubit j is bit j)
+#[pyfunction]
+fn run_batch<'py>(
+    circuit: &Bound<'py, PyCircuit>,
+    n_shots: usize,
+    py: Python<'py>,
+) -> PyResult<Bound<'py, PyArray1<u64>>> {
+    // Drop the circuit borrow before releasing the GIL, as in Circuit.run()
+    let (n, plan) = {
+        let circuit = circuit.try_borrow()?;
+        (circuit.n, circuit.plan())
+    };
+    let shots: Vec<u64> = py.allow_threads(|| {
+        let mut q = basis(n, 0);
+        q.apply_fused_circuit(&plan);
+        q.sample(n_shots, &mut thread_rng())
+            .into_iter()
+            .map(|s| s as u64)
+            .collect()
+    });
+    Ok(shots.into_pyarray(py))
 }
 
 /// Python module definition
 #[pymodule]
 fn rvecsim(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyQReg>()?;
+    m.add_class::<PyCircuit>()?;
     m.add_function(wrap_pyfunction!(ket, m)?)?;
+    m.add_function(wrap_pyfunction!(ghz, m)?)?;
+    m.add_function(wrap_pyfunction!(run_batch, m)?)?;
     Ok(())
 }
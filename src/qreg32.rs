@@ -0,0 +1,309 @@
+// Single-precision (complex64) quantum register
+//
+// QReg32 stores amplitudes as two f32 instead of two f64, halving the memory
+// of a state vector and the bytes each gate streams through. Gates run on the
+// same tiled kernels as QReg. Printing, measurement and the operators work on
+// the f32 amplitudes directly, accumulating sums in f64, so none of them
+// needs a widened copy of the state.
+
+use crate::{
+    all_close, cnot_kernel, dense_kernel, ket, nqubits, pair_kernel, perm_kernel, qterm,
+    quad_kernel, round_sigfigs, xmask_kernel, zmask_kernel, FusedGate, FusedOp, Op, QReg,
+    MAX_FUSED_QUBITS, MAX_QUBITS,
+};
+use ndarray::Array1;
+use num_complex::{Complex32, Complex64};
+use rand::Rng;
+use rayon::prelude::*;
+use std::fmt;
+use std::ops::{Add, Mul, Sub};
+
+/// Quantum register with complex64 amplitudes.
+#[derive(Clone)]
+pub struct QReg32 {
+    pub v: Vec<Complex32>,
+    pub n: usize,
+}
+
+fn narrow(x: Complex64) -> Complex32 {
+    Complex32::new(x.re as f32, x.im as f32)
+}
+
+fn widen(x: Complex32) -> Complex64 {
+    Complex64::new(x.re as f64, x.im as f64)
+}
+
+/// Significant figures an f32 carries; printing more only shows rounding noise.
+const F32_SIGFIGS: i32 = 7;
+
+impl QReg32 {
+    /// Create a quantum ket state from a string specification (see `ket()`).
+    /// Computational basis labels are built directly in single precision.
+    pub fn ket(vecstring: &str) -> Self {
+        if !vecstring.is_empty() && vecstring.chars().all(|ch| ch == '0' || ch == '1') {
+            let index = vecstring.chars().fold(0, |i, ch| 2 * i + (ch == '1') as usize);
+            return Self::basis(vecstring.len(), index);
+        }
+        Self::from(&ket(vecstring))
+    }
+
+    /// Create the computational basis state |index> on `n` qubits.
+    pub fn basis(n: usize, index: usize) -> Self {
+        assert!(n > 0, "Register needs at least one qubit");
+        assert!(n <= MAX_QUBITS, "Register can have at most {MAX_QUBITS} qubits, got {n}");
+        let len = 1 << n;
+        assert!(index < len, "Basis index {index} out of range for {n} qubits");
+        let mut q = Self::zeros(n);
+        q.v[index] = Complex32::new(1.0, 0.0);
+        q
+    }
+
+    /// Create the n-qubit GHZ state (|0...0> + |1...1>) / sqrt(2).
+    pub fn ghz(n: usize) -> Self {
+        assert!(n > 0, "Register needs at least one qubit");
+        assert!(n <= MAX_QUBITS, "Register can have at most {MAX_QUBITS} qubits, got {n}");
+        let mut q = Self::zeros(n);
+        let s2 = Complex32::new(std::f32::consts::FRAC_1_SQRT_2, 0.0);
+        q.v[0] = s2;
+        q.v[(1 << n) - 1] = s2;
+        q
+    }
+
+    /// Register from a vector of amplitudes (length a power of 2), normalized.
+    fn from_vec(v: Vec<Complex32>) -> Self {
+        assert!(!v.is_empty() && v.len().is_power_of_two());
+        let mut q = QReg32 {
+            n: nqubits(v.len()),
+            v,
+        };
+        q.normalize();
+        q
+    }
+
+    fn zeros(n: usize) -> Self {
+        let v = (0..1usize << n)
+            .into_par_iter()
+            .map(|_| Complex32::new(0.0, 0.0))
+            .collect();
+        QReg32 { v, n }
+    }
+
+    /// The same state with complex128 amplitudes.
+    pub fn to_qreg(&self) -> QReg {
+        QReg {
+            v: Array1::from_vec(self.v.par_iter().map(|&x| widen(x)).collect()),
+            n: self.n,
+        }
+    }
+
+    /// Calculate the L2 norm of the state vector (accumulated in f64).
+    pub fn norm(&self) -> f64 {
+        self.v
+            .par_iter()
+            .map(|x| x.norm_sqr() as f64)
+            .sum::<f64>()
+            .sqrt()
+    }
+
+    /// Check if this quantum state is close to another.
+    pub fn isclose(&self, other: &QReg32) -> bool {
+        self.v.len() == other.v.len()
+            && all_close(&self.v, &other.v, |a, b| (widen(a) - widen(b)).norm_sqr())
+    }
+
+    /// Check if this quantum state is close to a complex128 register.
+    pub fn isclose_qreg(&self, other: &QReg) -> bool {
+        self.isclose_complex(other.v.as_slice().unwrap())
+    }
+
+    /// Check if this quantum state is close to a slice of f64 values (treated as real).
+    pub fn isclose_slice(&self, other: &[f64]) -> bool {
+        self.v.len() == other.len()
+            && all_close(&self.v, other, |a, b| (widen(a) - b).norm_sqr())
+    }
+
+    /// Check if this quantum state is close to a slice of complex amplitudes.
+    pub fn isclose_complex(&self, other: &[Complex64]) -> bool {
+        self.v.len() == other.len()
+            && all_close(&self.v, other, |a, b| (widen(a) - b).norm_sqr())
+    }
+
+    /// Normalize the state vector in-place.
+    pub fn normalize(&mut self) {
+        let norm = self.norm();
+        assert!(norm > 1e-10, "Cannot normalize zero vector");
+        let scale = (1.0 / norm) as f32;
+        self.v.par_iter_mut().for_each(|x| *x *= scale);
+    }
+
+    /// Return string representation of significant terms in the quantum state.
+    pub fn terms(&self) -> String {
+        self.v
+            .iter()
+            .enumerate()
+            .filter(|(_, qi)| qi.norm() > 1e-8)
+            .map(|(i, &qi)| {
+                let re = round_sigfigs(qi.re as f64, F32_SIGFIGS);
+                let im = round_sigfigs(qi.im as f64, F32_SIGFIGS);
+                qterm(i, Complex64::new(re, im), self.n)
+            })
+            .collect::<Vec<_>>()
+            .join(" ")
+    }
+
+    /// Apply a dense gate produced by `fuse()` (or `Op::to_gate`) in-place.
+    pub fn apply_gate(&mut self, gate: &FusedGate) -> &mut Self {
+        let k = gate.qubits.len();
+        assert!(
+            (1..=MAX_FUSED_QUBITS).contains(&k),
+            "Gate must act on 1 to {MAX_FUSED_QUBITS} qubits, got {k}"
+        );
+        for (j, &q) in gate.qubits.iter().enumerate() {
+            assert!(q < self.n, "Invalid target qubit {q}. Must be in [0, {})", self.n);
+            assert!(!gate.qubits[..j].contains(&q), "Gate qubits must be different");
+        }
+        let m: Vec<Complex32> = gate.matrix.iter().map(|&x| narrow(x)).collect();
+        match gate.qubits[..] {
+            [t] => pair_kernel(&mut self.v, [m[0], m[1], m[2], m[3]], t),
+            [t, c] if gate.is_cnot() => cnot_kernel(&mut self.v, c, t),
+            [t, c] => quad_kernel(
+                &mut self.v,
+                [
+                    [m[0], m[1], m[2], m[3]],
+                    [m[4], m[5], m[6], m[7]],
+                    [m[8], m[9], m[10], m[11]],
+                    [m[12], m[13], m[14], m[15]],
+                ],
+                c,
+                t,
+            ),
+            _ => match gate.permutation() {
+                Some(perm) => {
+                    let perm: Vec<_> = perm.into_iter().map(|(r, x)| (r, narrow(x))).collect();
+                    perm_kernel(&mut self.v, &perm, &gate.qubits)
+                }
+                None => dense_kernel(&mut self.v, &m, &gate.qubits),
+            },
+        }
+        self
+    }
+
+    /// Apply X to every qubit set in `mask` in a single pass.
+    pub fn apply_xmask(&mut self, mask: usize) -> &mut Self {
+        assert!(mask < self.v.len(), "X mask {mask:#b} has qubits outside [0, {})", self.n);
+        if mask != 0 {
+            xmask_kernel(&mut self.v, mask);
+        }
+        self
+    }
+
+    /// Apply Z to every qubit set in `mask` in a single pass.
+    pub fn apply_zmask(&mut self, mask: usize) -> &mut Self {
+        assert!(mask < self.v.len(), "Z mask {mask:#b} has qubits outside [0, {})", self.n);
+        if mask != 0 {
+            zmask_kernel(&mut self.v, mask);
+        }
+        self
+    }
+
+    /// Apply a step of a fused circuit in-place.
+    pub fn apply_fused(&mut self, op: &FusedOp) -> &mut Self {
+        match op {
+            FusedOp::Gate(gate) => self.apply_gate(gate),
+            FusedOp::XMask(mask) => self.apply_xmask(*mask),
+            FusedOp::ZMask(mask) => self.apply_zmask(*mask),
+        }
+    }
+
+    /// Apply a single circuit operation in-place.
+    pub fn apply_op(&mut self, op: Op) -> &mut Self {
+        self.apply_gate(&op.to_gate())
+    }
+
+    /// Apply a sequence of circuit operations in-place, in order.
+    pub fn apply_circuit(&mut self, ops: &[Op]) -> &mut Self {
+        for &op in ops {
+            self.apply_op(op);
+        }
+        self
+    }
+
+    /// Apply a fused circuit (see `fuse()`) in-place, in order.
+    pub fn apply_fused_circuit(&mut self, ops: &[FusedOp]) -> &mut Self {
+        for op in ops {
+            self.apply_fused(op);
+        }
+        self
+    }
+
+    /// Measure qubit `i` `ntimes` times, collapsing the state each time.
+    pub fn measure(&mut self, i: usize, ntimes: usize, rng: &mut impl Rng) -> Vec<usize> {
+        assert!(i < self.n, "Invalid qubit {i}. Must be in [0, {})", self.n);
+
+        let mut results = Vec::with_capacity(ntimes);
+        for _ in 0..ntimes {
+            let prob0: f64 = self
+                .v
+                .par_iter()
+                .enumerate()
+                .filter(|(idx, _)| (idx >> i) & 1 == 0)
+                .map(|(_, amp)| amp.norm_sqr() as f64)
+                .sum();
+
+            let outcome = if rng.r#gen::<f64>() < prob0 { 0 } else { 1 };
+            results.push(outcome);
+
+            self.v.par_iter_mut().enumerate().for_each(|(idx, amp)| {
+                if (idx >> i) & 1 != outcome {
+                    *amp = Complex32::new(0.0, 0.0);
+                }
+            });
+            self.normalize();
+        }
+        results
+    }
+}
+
+impl fmt::Display for QReg32 {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        write!(f, "{}", self.terms())
+    }
+}
+
+impl Add for QReg32 {
+    type Output = QReg32;
+    fn add(self, other: QReg32) -> QReg32 {
+        assert_eq!(self.v.len(), other.v.len(), "Registers must have the same size");
+        QReg32::from_vec(self.v.iter().zip(&other.v).map(|(&a, &b)| a + b).collect())
+    }
+}
+
+impl Sub for QReg32 {
+    type Output = QReg32;
+    fn sub(self, other: QReg32) -> QReg32 {
+        assert_eq!(self.v.len(), other.v.len(), "Registers must have the same size");
+        QReg32::from_vec(self.v.iter().zip(&other.v).map(|(&a, &b)| a - b).collect())
+    }
+}
+
+impl Mul for QReg32 {
+    type Output = QReg32;
+    /// Tensor product of two quantum states.
+    fn mul(self, other: QReg32) -> QReg32 {
+        let v = self
+            .v
+            .iter()
+            .flat_map(|&a| other.v.iter().map(move |&b| a * b))
+            .collect();
+        QReg32::from_vec(v)
+    }
+}
+
+impl From<&QReg> for QReg32 {
+    fn from(q: &QReg) -> Self {
+        QReg32 {
+            v: q.v.as_slice().unwrap().par_iter().map(|&x| narrow(x)).collect(),
+            n: q.n,
+        }
+    }
+}
@@ -0,0 +1,332 @@
+// SIMD kernels for single-qubit gates
+//
+// A 2x2 gate [m00, m01, m10, m11] maps each amplitude pair (a, b) to
+// (m00*a + m01*b, m10*a + m11*b). The kernels below apply it to runs of pairs
+// using AVX2 or AVX-512 when available; the variant is picked once at runtime.
+//
+// Gates with purely real entries (H, X, Z, ...) get their own kernels: a real
+// coefficient scales the re and im lanes independently, so the interleaved
+// data can be treated as a flat f64 array with no re/im shuffles at all.
+
+use num_complex::Complex64;
+
+/// Kernels for applying a 2x2 gate to runs of amplitude pairs.
+#[derive(Copy, Clone)]
+pub(crate) struct Kernel1q {
+    /// Pairs (lo[k], hi[k]) for every k; `lo` and `hi` have equal length
+    pub strided: fn(&mut [Complex64], &mut [Complex64], &[Complex64; 4]),
+    /// Pairs (v[2k], v[2k + 1]) for every k (target qubit 0)
+    pub adjacent: fn(&mut [Complex64], &[Complex64; 4]),
+    /// As `strided`, for a gate with real entries
+    pub strided_real: fn(&mut [Complex64], &mut [Complex64], &[f64; 4]),
+    /// As `adjacent`, for a gate with real entries
+    pub adjacent_real: fn(&mut [Complex64], &[f64; 4]),
+}
+
+/// Pick the widest kernel supported by the running CPU.
+pub(crate) fn select_kernel_1q() -> Kernel1q {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma") {
+            if is_x86_feature_detected!("avx512f") {
+                return Kernel1q {
+                    strided: x86::strided_avx512,
+                    adjacent: x86::adjacent_avx2,
+                    strided_real: x86::strided_real_avx512,
+                    adjacent_real: x86::adjacent_real_avx2,
+                };
+            }
+            return x86::AVX2;
+        }
+    }
+    Kernel1q {
+        strided: strided_scalar,
+        adjacent: adjacent_scalar,
+        strided_real: strided_real_scalar,
+        adjacent_real: adjacent_real_scalar,
+    }
+}
+
+pub(crate) fn strided_scalar(lo: &mut [Complex64], hi: &mut [Complex64], m: &[Complex64; 4]) {
+    for (a, b) in lo.iter_mut().zip(hi.iter_mut()) {
+        let (qa, qb) = (*a, *b);
+        *a = m[0] * qa + m[1] * qb;
+        *b = m[2] * qa + m[3] * qb;
+    }
+}
+
+pub(crate) fn adjacent_scalar(v: &mut [Complex64], m: &[Complex64; 4]) {
+    for pair in v.chunks_exact_mut(2) {
+        let (qa, qb) = (pair[0], pair[1]);
+        pair[0] = m[0] * qa + m[1] * qb;
+        pair[1] = m[2] * qa + m[3] * qb;
+    }
+}
+
+pub(crate) fn strided_real_scalar(lo: &mut [Complex64], hi: &mut [Complex64], m: &[f64; 4]) {
+    for (a, b) in lo.iter_mut().zip(hi.iter_mut()) {
+        let (qa, qb) = (*a, *b);
+        *a = qa * m[0] + qb * m[1];
+        *b = qa * m[2] + qb * m[3];
+    }
+}
+
+pub(crate) fn adjacent_real_scalar(v: &mut [Complex64], m: &[f64; 4]) {
+    for pair in v.chunks_exact_mut(2) {
+        let (qa, qb) = (pair[0], pair[1]);
+        pair[0] = qa * m[0] + qb * m[1];
+        pair[1] = qa * m[2] + qb * m[3];
+    }
+}
+
+#[cfg(target_arch = "x86_64")]
+mod x86 {
+    use super::{
+        adjacent_real_scalar, adjacent_scalar, strided_real_scalar, strided_scalar, Kernel1q,
+    };
+    use num_complex::Complex64;
+    use std::arch::x86_64::*;
+
+    /// Kernels for CPUs with AVX2 and FMA
+    pub const AVX2: Kernel1q = Kernel1q {
+        strided: strided_avx2,
+        adjacent: adjacent_avx2,
+        strided_real: strided_real_avx2,
+        adjacent_real: adjacent_real_avx2,
+    };
+
+    // Complex64 is #[repr(C)] { re, im }, so a slice of n amplitudes is 2n
+    // interleaved f64 values: one __m256d holds 2 amplitudes, one __m512d 4.
+
+    pub fn strided_avx2(lo: &mut [Complex64], hi: &mut [Complex64], m: &[Complex64; 4]) {
+        // SAFETY: only selected after detecting avx2 and fma
+        unsafe { strided_avx2_impl(lo, hi, m) }
+    }
+
+    pub fn strided_avx512(lo: &mut [Complex64], hi: &mut [Complex64], m: &[Complex64; 4]) {
+        // SAFETY: only selected after detecting avx512f
+        unsafe { strided_avx512_impl(lo, hi, m) }
+    }
+
+    pub fn adjacent_avx2(v: &mut [Complex64], m: &[Complex64; 4]) {
+        // SAFETY: only selected after detecting avx2 and fma
+        unsafe { adjacent_avx2_impl(v, m) }
+    }
+
+    pub fn strided_real_avx2(lo: &mut [Complex64], hi: &mut [Complex64], m: &[f64; 4]) {
+        // SAFETY: only selected after detecting avx2 and fma
+        unsafe { strided_real_avx2_impl(lo, hi, m) }
+    }
+
+    pub fn strided_real_avx512(lo: &mut [Complex64], hi: &mut [Complex64], m: &[f64; 4]) {
+        // SAFETY: only selected after detecting avx512f
+        unsafe { strided_real_avx512_impl(lo, hi, m) }
+    }
+
+    pub fn adjacent_real_avx2(v: &mut [Complex64], m: &[f64; 4]) {
+        // SAFETY: only selected after detecting avx2 and fma
+        unsafe { adjacent_real_avx2_impl(v, m) }
+    }
+
+    /// m0 * a + m1 * b for packed complex a, b and complex scalars m0, m1
+    /// given as broadcast (re, im) parts.
+    #[inline]
+    #[target_feature(enable = "avx2,fma")]
+    fn madd2_256(a: __m256d, b: __m256d, m0: (__m256d, __m256d), m1: (__m256d, __m256d)) -> __m256d {
+        // Swapping re/im lets fmaddsub produce (re*re - im*im, im*re + re*im)
+        let t = _mm256_mul_pd(_mm256_permute_pd::<0b0101>(a), m0.1);
+        let t = _mm256_fmadd_pd(_mm256_permute_pd::<0b0101>(b), m1.1, t);
+        let r = _mm256_fmaddsub_pd(a, m0.0, t);
+        _mm256_fmadd_pd(b, m1.0, r)
+    }
+
+    #[inline]
+    #[target_feature(enable = "avx512f")]
+    fn madd2_512(a: __m512d, b: __m512d, m0: (__m512d, __m512d), m1: (__m512d, __m512d)) -> __m512d {
+        let t = _mm512_mul_pd(_mm512_permute_pd::<0b0101_0101>(a), m0.1);
+        let t = _mm512_fmadd_pd(_mm512_permute_pd::<0b0101_0101>(b), m1.1, t);
+        let r = _mm512_fmaddsub_pd(a, m0.0, t);
+        _mm512_fmadd_pd(b, m1.0, r)
+    }
+
+    #[target_feature(enable = "avx2,fma")]
+    unsafe fn strided_avx2_impl(lo: &mut [Complex64], hi: &mut [Complex64], m: &[Complex64; 4]) {
+        assert_eq!(lo.len(), hi.len());
+        let n = lo.len();
+        let set = |z: Complex64| (_mm256_set1_pd(z.re), _mm256_set1_pd(z.im));
+        let (m00, m01, m10, m11) = (set(m[0]), set(m[1]), set(m[2]), set(m[3]));
+        let (pl, ph) = (lo.as_mut_ptr() as *mut f64, hi.as_mut_ptr() as *mut f64);
+        let mut k = 0;
+        while k + 2 <= n {
+            unsafe {
+                let a = _mm256_loadu_pd(pl.add(2 * k));
+                let b = _mm256_loadu_pd(ph.add(2 * k));
+                _mm256_storeu_pd(pl.add(2 * k), madd2_256(a, b, m00, m01));
+                _mm256_storeu_pd(ph.add(2 * k), madd2_256(a, b, m10, m11));
+            }
+            k += 2;
+        }
+        strided_scalar(&mut lo[k..], &mut hi[k..], m);
+    }
+
+    #[target_feature(enable = "avx512f")]
+    unsafe fn strided_avx512_impl(lo: &mut [Complex64], hi: &mut [Complex64], m: &[Complex64; 4]) {
+        assert_eq!(lo.len(), hi.len());
+        let n = lo.len();
+        let set = |z: Complex64| (_mm512_set1_pd(z.re), _mm512_set1_pd(z.im));
+        let (m00, m01, m10, m11) = (set(m[0]), set(m[1]), set(m[2]), set(m[3]));
+        let (pl, ph) = (lo.as_mut_ptr() as *mut f64, hi.as_mut_ptr() as *mut f64);
+        let mut k = 0;
+        while k + 4 <= n {
+            unsafe {
+                let a = _mm512_loadu_pd(pl.add(2 * k));
+                let b = _mm512_loadu_pd(ph.add(2 * k));
+                _mm512_storeu_pd(pl.add(2 * k), madd2_512(a, b, m00, m01));
+                _mm512_storeu_pd(ph.add(2 * k), madd2_512(a, b, m10, m11));
+            }
+            k += 4;
+        }
+        strided_scalar(&mut lo[k..], &mut hi[k..], m);
+    }
+
+    #[target_feature(enable = "avx2,fma")]
+    unsafe fn adjacent_avx2_impl(v: &mut [Complex64], m: &[Complex64; 4]) {
+        // One register holds a whole pair (a, b). Broadcast a and b to both
+        // halves and use per-half coefficients: [m00 | m10] and [m01 | m11].
+        let set = |lo: Complex64, hi: Complex64| {
+            (
+                _mm256_setr_pd(lo.re, lo.re, hi.re, hi.re),
+                _mm256_setr_pd(lo.im, lo.im, hi.im, hi.im),
+            )
+        };
+        let (col0, col1) = (set(m[0], m[2]), set(m[1], m[3]));
+        let n = v.len() / 2;
+        let p = v.as_mut_ptr() as *mut f64;
+        for k in 0..n {
+            unsafe {
+                let x = _mm256_loadu_pd(p.add(4 * k));
+                let a = _mm256_permute2f128_pd::<0x00>(x, x);
+                let b = _mm256_permute2f128_pd::<0x11>(x, x);
+                _mm256_storeu_pd(p.add(4 * k), madd2_256(a, b, col0, col1));
+            }
+        }
+        adjacent_scalar(&mut v[2 * n..], m);
+    }
+
+    #[target_feature(enable = "avx2,fma")]
+    unsafe fn strided_real_avx2_impl(lo: &mut [Complex64], hi: &mut [Complex64], m: &[f64; 4]) {
+        assert_eq!(lo.len(), hi.len());
+        let n = lo.len();
+        let [m00, m01, m10, m11] = m.map(|x| _mm256_set1_pd(x));
+        let (pl, ph) = (lo.as_mut_ptr() as *mut f64, hi.as_mut_ptr() as *mut f64);
+        let mut k = 0;
+        while k + 2 <= n {
+            unsafe {
+                let a = _mm256_loadu_pd(pl.add(2 * k));
+                let b = _mm256_loadu_pd(ph.add(2 * k));
+                _mm256_storeu_pd(pl.add(2 * k), _mm256_fmadd_pd(m00, a, _mm256_mul_pd(m01, b)));
+                _mm256_storeu_pd(ph.add(2 * k), _mm256_fmadd_pd(m10, a, _mm256_mul_pd(m11, b)));
+            }
+            k += 2;
+        }
+        strided_real_scalar(&mut lo[k..], &mut hi[k..], m);
+    }
+
+    #[target_feature(enable = "avx512f")]
+    unsafe fn strided_real_avx512_impl(lo: &mut [Complex64], hi: &mut [Complex64], m: &[f64; 4]) {
+        assert_eq!(lo.len(), hi.len());
+        let n = lo.len();
+        let [m00, m01, m10, m11] = m.map(|x| _mm512_set1_pd(x));
+        let (pl, ph) = (lo.as_mut_ptr() as *mut f64, hi.as_mut_ptr() as *mut f64);
+        let mut k = 0;
+        while k + 4 <= n {
+            unsafe {
+                let a = _mm512_loadu_pd(pl.add(2 * k));
+                let b = _mm512_loadu_pd(ph.add(2 * k));
+                _mm512_storeu_pd(pl.add(2 * k), _mm512_fmadd_pd(m00, a, _mm512_mul_pd(m01, b)));
+                _mm512_storeu_pd(ph.add(2 * k), _mm512_fmadd_pd(m10, a, _mm512_mul_pd(m11, b)));
+            }
+            k += 4;
+        }
+        strided_real_scalar(&mut lo[k..], &mut hi[k..], m);
+    }
+
+    #[target_feature(enable = "avx2,fma")]
+    unsafe fn adjacent_real_avx2_impl(v: &mut [Complex64], m: &[f64; 4]) {
+        let col0 = _mm256_setr_pd(m[0], m[0], m[2], m[2]);
+        let col1 = _mm256_setr_pd(m[1], m[1], m[3], m[3]);
+        let n = v.len() / 2;
+        let p = v.as_mut_ptr() as *mut f64;
+        for k in 0..n {
+            unsafe {
+                let x = _mm256_loadu_pd(p.add(4 * k));
+                let a = _mm256_permute2f128_pd::<0x00>(x, x);
+                let b = _mm256_permute2f128_pd::<0x11>(x, x);
+                _mm256_storeu_pd(p.add(4 * k), _mm256_fmadd_pd(col0, a, _mm256_mul_pd(col1, b)));
+            }
+        }
+        adjacent_real_scalar(&mut v[2 * n..], m);
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use rand::rngs::StdRng;
+    use rand::{Rng, SeedableRng};
+
+    fn random_vec(rng: &mut StdRng, len: usize) -> Vec<Complex64> {
+        (0..len)
+            .map(|_| Complex64::new(rng.r#gen::<f64>() - 0.5, rng.r#gen::<f64>() - 0.5))
+            .collect()
+    }
+
+    fn assert_close(a: &[Complex64], b: &[Complex64]) {
+        assert_eq!(a.len(), b.len());
+        for (x, y) in a.iter().zip(b) {
+            assert!((x - y).norm() < 1e-12, "{x:?} != {y:?}");
+        }
+    }
+
+    #[test]
+    fn test_selected_kernel_matches_scalar() {
+        let mut rng = StdRng::seed_from_u64(7);
+        let m: [Complex64; 4] = random_vec(&mut rng, 4).try_into().unwrap();
+        let mut kernels = vec![select_kernel_1q()];
+        #[cfg(target_arch = "x86_64")]
+        if is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma") {
+            kernels.push(x86::AVX2);
+        }
+        let mr = m.map(|z| z.re);
+        let m_real = mr.map(|x| Complex64::new(x, 0.0));
+
+        // Odd lengths exercise the scalar remainder loops
+        for (kernel, len) in kernels.iter().flat_map(|k| [1, 2, 3, 4, 7, 8, 33].map(|len| (k, len))) {
+            let (lo, hi) = (random_vec(&mut rng, len), random_vec(&mut rng, len));
+            let (mut lo1, mut hi1) = (lo.clone(), hi.clone());
+            let (mut lo2, mut hi2) = (lo.clone(), hi.clone());
+            strided_scalar(&mut lo1, &mut hi1, &m);
+            (kernel.strided)(&mut lo2, &mut hi2, &m);
+            assert_close(&lo1, &lo2);
+            assert_close(&hi1, &hi2);
+
+            let (mut lo1, mut hi1) = (lo.clone(), hi.clone());
+            let (mut lo2, mut hi2) = (lo, hi);
+            strided_scalar(&mut lo1, &mut hi1, &m_real);
+            (kernel.strided_real)(&mut lo2, &mut hi2, &mr);
+            assert_close(&lo1, &lo2);
+            assert_close(&hi1, &hi2);
+
+            let v = random_vec(&mut rng, 2 * len);
+            let (mut v1, mut v2) = (v.clone(), v.clone());
+            adjacent_scalar(&mut v1, &m);
+            (kernel.adjacent)(&mut v2, &m);
+            assert_close(&v1, &v2);
+
+            let (mut v1, mut v2) = (v.clone(), v);
+            adjacent_scalar(&mut v1, &m_real);
+            (kernel.adjacent_real)(&mut v2, &mr);
+            assert_close(&v1, &v2);
+        }
+    }
+}
@@ -3,6 +3,9 @@
 Quantify the GIL's impact on Rayon parallelism.
 
 Compare CPU utilization to understand why Python→Rust is slower than native Rust.
+
+The measurement helpers here (available_cores, pin_physical_cores, warm_up,
+cpu_seconds, cpu_percent_since) are shared with test_parallelism.py.
 """
 
 import time
@@ -10,16 +13,64 @@ import psutil
 import os
 from rvecsim import ket
 
+def available_cores():
+    """Number of CPUs this process may run on (its affinity mask on Linux)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return psutil.cpu_count(logical=True)
+
+def pin_physical_cores():
+    """Pin this process to one CPU per physical core it may run on, and
+    return the pinned CPUs.
+
+    Must run before warm_up(): Rayon sizes its pool from the affinity mask
+    on first use, so this also stops it from putting two workers on the SMT
+    siblings of one core, which would halve the efficiency figures. Cores
+    are read from sysfs on Linux; elsewhere nothing is pinned and the
+    logical CPUs are returned."""
+    if not hasattr(os, 'sched_setaffinity'):
+        return list(range(psutil.cpu_count(logical=True)))
+    cores = {}
+    for cpu in sorted(os.sched_getaffinity(0)):
+        topology = f'/sys/devices/system/cpu/cpu{cpu}/topology/'
+        try:
+            with open(topology + 'physical_package_id') as f:
+                package = f.read().strip()
+            with open(topology + 'core_id') as f:
+                core = f.read().strip()
+        except OSError:
+            core, package = cpu, None
+        cores.setdefault((package, core), cpu)
+    cpus = sorted(cores.values())
+    os.sched_setaffinity(0, cpus)
+    return cpus
+
+def warm_up():
+    """Spin up Rayon's worker threads before anything is timed."""
+    ket('0' * 20).H(0)
+
+def cpu_seconds(process):
+    """User + system CPU time consumed by all threads of the process."""
+    t = process.cpu_times()
+    return t.user + t.system
+
+def cpu_percent_since(process, cpu_start, start, end):
+    """CPU time used between two cpu_seconds() readings over the wall time
+    between two perf_counter() readings, as a percentage of one core."""
+    return 100 * (cpu_seconds(process) - cpu_start) / (end - start)
+
 def run_benchmark_with_monitoring(n_qubits, n_trials=3):
-    """Run GHZ benchmark while monitoring CPU usage."""
+    """Run GHZ benchmark while monitoring CPU usage.
+
+    CPU usage is the CPU time spent during the run divided by its wall time,
+    so 100% means one core busy for the whole run."""
     process = psutil.Process(os.getpid())
 
     times = []
     cpu_usages = []
 
     for _ in range(n_trials):
-        # Reset CPU measurement
-        process.cpu_percent(interval=None)
+        cpu_start = cpu_seconds(process)
 
         # Run computation
         start = time.perf_counter()
@@ -29,7 +80,7 @@ def run_benchmark_with_monitoring(n_qubits, n_trials=3):
         end = time.perf_counter()
 
         # Measure CPU usage
-        cpu = process.cpu_percent(interval=None)
+        cpu = cpu_percent_since(process, cpu_start, start, end)
 
         times.append(end - start)
         cpu_usages.append(cpu)
@@ -40,12 +91,16 @@ def run_benchmark_with_monitoring(n_qubits, n_trials=3):
     return avg_time, avg_cpu
 
 def main():
-    n_cores = psutil.cpu_count(logical=True)
+    n_logical = available_cores()
+    cpus = pin_physical_cores()
+    n_cores = len(cpus)
+    warm_up()
 
     print("=" * 70)
     print("GIL Impact on Rayon Parallelism")
     print("=" * 70)
-    print(f"\nSystem: {n_cores} cores available\n")
+    print(f"\nSystem: {n_logical} CPUs available, pinned to one per physical "
+          f"core: {n_cores} cores (CPUs {cpus})\n")
 
     print("Expected behavior:")
     print("  - Native Rust: Should use ~80-100% of all cores (700-800% CPU)")
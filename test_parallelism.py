@@ -10,17 +10,8 @@ import time
 import psutil
 import os
 from rvecsim import ket
-
-def monitor_cpu_usage(duration=0.5):
-    """Monitor CPU usage over a duration."""
-    process = psutil.Process(os.getpid())
-
-    # Take initial measurement
-    cpu_percent_start = process.cpu_percent(interval=None)
-    time.sleep(duration)
-    cpu_percent = process.cpu_percent(interval=None)
-
-    return cpu_percent
+from test_gil_impact import (cpu_percent_since, cpu_seconds, pin_physical_cores,
+                             warm_up)
 
 def test_parallelism():
     """
@@ -39,9 +30,13 @@ def test_parallelism():
     print("Running 20-qubit GHZ state preparation (should use multiple cores):")
     print("-" * 70)
 
+    cpus = pin_physical_cores()
+    warm_up()
+    print(f"Pinned to one CPU per physical core: {len(cpus)} cores (CPUs {cpus})\n")
+
     # Start monitoring
     process = psutil.Process(os.getpid())
-    process.cpu_percent(interval=None)  # Initialize
+    cpu_start = cpu_seconds(process)
 
     # Run computation
     start = time.perf_counter()
@@ -51,7 +46,7 @@ def test_parallelism():
     end = time.perf_counter()
 
     # Get CPU usage (over the last computation)
-    cpu_percent = process.cpu_percent(interval=None)
+    cpu_percent = cpu_percent_since(process, cpu_start, start, end)
 
     elapsed = end - start
 
@@ -79,8 +74,7 @@ def test_parallelism():
     print("Running multiple iterations for better measurement:")
     print("-" * 70)
 
-    process.cpu_percent(interval=None)  # Reset
-
+    cpu_start = cpu_seconds(process)
     start = time.perf_counter()
     for _ in range(5):
         q = ket('0' * 18).H(0)
@@ -88,7 +82,7 @@ def test_parallelism():
             q = q.CNOT(i, i + 1)
     end = time.perf_counter()
 
-    cpu_percent = process.cpu_percent(interval=None)
+    cpu_percent = cpu_percent_since(process, cpu_start, start, end)
 
     print(f"5 iterations of 18-qubit GHZ: {(end-start)*1000:.2f} ms")
     print(f"Average CPU usage: {cpu_percent:.1f}%")
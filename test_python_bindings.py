@@ -6,7 +6,7 @@ Run with: python test_python_bindings.py
 (Make sure to activate the virtual environment and run `maturin develop --features pyo3` first)
 """
 
-from rvecsim import ket
+from rvecsim import Circuit, ket, run_batch
 
 def test_basic_operations():
     """Test basic quantum operations."""
@@ -40,6 +40,14 @@ def test_entanglement():
     ghz = ket('000').H(0).CNOT(0, 1).CNOT(1, 2)
     print(f"GHZ state (|000> + |111>)/√2: {ghz}")
 
+    # Same GHZ state built from a gate list in a single call
+    ghz = ket('000').apply_circuit([('H', 0), ('CNOT', 0, 1), ('CNOT', 1, 2)])
+    print(f"GHZ via apply_circuit: {ghz}")
+
+    # Prebuilt circuit, reusable across runs
+    circ = Circuit(3).H(0).CNOT(0, 1).CNOT(1, 2)
+    print(f"GHZ via Circuit.run(): {circ.run()}")
+
     print()
 
 def test_operators():
@@ -75,6 +83,11 @@ def test_measurement():
     print(f"Measure |+> 10 times: {result}")
     print(f"  (Should be mix of 0s and 1s)")
 
+    # Many shots of a whole circuit in one call
+    shots = run_batch(Circuit(2).H(0).CNOT(0, 1), 1000)
+    print(f"Bell state, 1000 shots: {sorted(set(shots.tolist()))}")
+    print(f"  (Should be only 0 (|00>) and 3 (|11>))")
+
     print()
 
 def test_comparison():
@@ -103,6 +116,21 @@ def test_properties():
 
     print()
 
+def test_single_precision():
+    """Test complex64 registers against complex128."""
+    print("=== Single Precision ===")
+
+    ops = [('H', 0), ('CNOT', 0, 1), ('S', 1), ('CPHASE', 1, 2), ('H', 2)]
+    q64 = ket('000', dtype='complex64').apply_circuit(ops)
+    q128 = ket('000').apply_circuit(ops)
+    print(f"dtype: {q64.dtype}, amplitudes: {q64.amplitudes.dtype}")
+    print(f"complex64 circuit isclose complex128: {q64.isclose(q128)}")
+    print(f"complex64 circuit: {q64}")
+    print(f"complex64 |0> + |1>: {ket('0', dtype='complex64') + ket('1', dtype='complex64')}")
+    print(f"complex64 |+> measured 5 times: {ket('+', dtype='complex64').M(0, ntimes=5)}")
+
+    print()
+
 def main():
     """Run all tests."""
     print("\n" + "="*50)
@@ -115,6 +143,7 @@ def main():
     test_measurement()
     test_comparison()
     test_properties()
+    test_single_precision()
 
     print("="*50)
     print("✅ All tests completed successfully!")